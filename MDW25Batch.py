@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""
+Headless batch mode for MAAGE.
+
+Builds what MDW25Gui's Run button produces -- the filenames dict, the
+per-tab adjudication flags and the move increment -- straight from the
+parsed cheat sheet, and writes it as JSON. No window is created, so it runs
+on CI machines and overnight replication jobs without a display.
+
+By default the cheat sheet is only read, so repeated runs (and --seed
+replications) see the same move. --increment-move opts in to the GUI's
+post-processing: it re-applies journaled edits left by a crashed GUI
+session and then rewrites the cheat sheet with every 'Move N' incremented.
+
+Usage:
+    python MDW25Batch.py [--cheatsheet MAAGECheatSheet.txt] [--disable TAB ...]
+                         [--only TAB ...] [--increment-move] [--workspace]
+                         [--seed N] [--output run.json]
+"""
+
+import argparse
+import json
+import sys
+
+import MDW25GuiHeader as gui  # Custom header file with helper functions
+import adjudicationLibrary as adj
+
+
+def resolveAdjudicationFlags(tabNames, disable=(), only=()):
+    """
+    Work out the per-tab "Use data in this tab for adjudication" flags.
+
+    Args:
+        tabNames (List[str]): Cheat sheet tab names, in order.
+        disable (Iterable[str]): Tabs to switch off (case-insensitive).
+        only (Iterable[str]): If given, switch off every tab not listed.
+
+    Returns:
+        List[int]: 1/0 per tab.
+
+    Raises:
+        ValueError: If a named tab is not in the cheat sheet.
+    """
+    known = {name.lower() for name in tabNames}
+    disable = {name.lower() for name in disable}
+    only = {name.lower() for name in only}
+    unknown = sorted((disable | only) - known)
+    if unknown:
+        raise ValueError(f"Unknown tab(s): {', '.join(unknown)}")
+
+    return [0 if name.lower() in disable or (only and name.lower() not in only) else 1
+            for name in tabNames]
+
+
+def checkTabSheets(tabData, adjudicationFlags):
+    """
+    Check the sheets the run will select against the workbooks.
+
+    Sheets a workbook lacks fall back to its first sheet, as in the GUI
+    (see MDW25GuiHeader.resolveSheetName).
+
+    Args:
+        tabData (List[Dict]): parseCheatSheet output.
+        adjudicationFlags (List[int]): 1/0 per non-Home tab.
+
+    Returns:
+        List[str]: One warning per substituted sheet.
+
+    Raises:
+        ValueError: If a tab used for adjudication has no readable sheets.
+    """
+    tabs = [tab for tab in tabData if tab["name"].lower() != "home"]
+    warnings = []
+    for tab, flag in zip(tabs, adjudicationFlags):
+        if not flag:
+            continue
+        sheetNames = gui.getExcelSheetNames(tab["filepath"])
+        if not sheetNames:
+            raise ValueError(f"Tab '{tab['name']}': cannot read sheets from {tab['filepath']}")
+        for entry in tab["entries"]:
+            resolved = gui.resolveSheetName(entry["sheetName"], sheetNames)
+            if resolved != entry["sheetName"]:
+                warnings.append(f"Tab '{tab['name']}': sheet '{entry['sheetName']}' not in workbook, "
+                                f"using '{resolved}'")
+    return warnings
+
+
+def buildBatchRun(tabData, adjudicationFlags, incrementMove=True, includeWorkspace=False):
+    """
+    Build the JSON-ready result of one run.
+
+    Args:
+        tabData (List[Dict]): parseCheatSheet output.
+        adjudicationFlags (List[int]): 1/0 per non-Home tab.
+        incrementMove (bool): Whether 'Move N' is incremented after the run
+            (this rewrites the cheat sheet).
+        includeWorkspace (bool): Include a buildWorkspaceSnapshot-style dump.
+
+    Returns:
+        Dict: filenames (with '_postprocess' as in the GUI), adjudicationFlags,
+        tabs and incrementMove, plus workspace if requested.
+    """
+    tabs = [tab for tab in tabData if tab["name"].lower() != "home"]
+    filenames = gui.buildFilenamesDictFromTabData(tabData, adjudicationFlags)
+    if incrementMove:
+        filenames["_postprocess"] = "increment_move"
+
+    result = {
+        "filenames": filenames,
+        "adjudicationFlags": adjudicationFlags,
+        "tabs": [tab["name"] for tab in tabs],
+        "incrementMove": incrementMove
+    }
+    if includeWorkspace:
+        result["workspace"] = {
+            tab["name"]: {
+                "use_for_adjudication": bool(flag),
+                "entries": gui.tabDataEntryValues(tab)
+            } for tab, flag in zip(tabs, adjudicationFlags)
+        }
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the MAAGE pipeline without the GUI and emit JSON.")
+    parser.add_argument("--cheatsheet", default="MAAGECheatSheet.txt", help="cheat sheet file")
+    parser.add_argument("--disable", action="append", default=[], metavar="TAB",
+                        help="do not use this tab for adjudication (repeatable)")
+    parser.add_argument("--only", action="append", default=[], metavar="TAB",
+                        help="use only these tabs for adjudication (repeatable)")
+    parser.add_argument("--increment-move", action=argparse.BooleanOptionalAction, default=False,
+                        help="rewrite the cheat sheet with 'Move N' incremented after the run (default: off)")
+    parser.add_argument("--workspace", action="store_true", help="include the per-tab workspace snapshot")
+    parser.add_argument("--seed", type=int, metavar="N",
+                        help="scenario seed for Monte Carlo resolution (recorded with the move number)")
+    parser.add_argument("--output", metavar="FILE", help="write JSON here instead of stdout")
+    parser.add_argument("--indent", type=int, default=2, help="JSON indent")
+    args = parser.parse_args(argv)
+
+    # Report cheat sheet write problems on stderr instead of in message boxes
+    gui.cheatSheetWriter.onFlushed = None
+    gui.cheatSheetWriter.onError = lambda path, error: print(f"Failed to write {path}: {error}", file=sys.stderr)
+
+    try:
+        if args.increment_move:
+            gui.recoverCheatSheet(args.cheatsheet)  # Re-apply edits journaled before a crash
+        elif gui.unsavedCheatSheetEdits(args.cheatsheet):
+            print(f"Ignoring unsaved edits in {gui.cheatSheetJournalPath(args.cheatsheet)} "
+                  "(open the GUI or use --increment-move to apply them)", file=sys.stderr)
+        tabData = gui.loadCheatSheet(args.cheatsheet).tabs()
+    except OSError as e:
+        parser.error(f"cannot read cheat sheet: {e}")
+
+    tabNames = [tab["name"] for tab in tabData if tab["name"].lower() != "home"]
+    try:
+        adjudicationFlags = resolveAdjudicationFlags(tabNames, args.disable, args.only)
+        for warning in checkTabSheets(tabData, adjudicationFlags):
+            print(warning, file=sys.stderr)
+    except ValueError as e:
+        parser.error(str(e))
+
+    result = buildBatchRun(tabData, adjudicationFlags, args.increment_move, args.workspace)
+    result["cheatSheet"] = args.cheatsheet
+    if args.seed is not None:
+        # Rolls are keyed by (seed, move, engagement), so these two reproduce the run
+        result["seed"] = args.seed
+        result["moveNumber"] = adj.currentMoveNumber(args.cheatsheet)
+    text = json.dumps(result, indent=args.indent)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    # Same post-processing as the GUI's Run button
+    if args.increment_move:
+        gui.incrementAllMoveNumbers(args.cheatsheet)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
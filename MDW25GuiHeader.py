@@ -3,21 +3,846 @@ Created on Wed Jul 23 17:40:40 2025
 @author: mitch
 """
 
+import collections
+import datetime
+import hashlib
+import io
+import itertools
+import json
+import locale
+import math
 import os
+import queue
 import re
-import string
+import shutil
 import tempfile
+import threading
+import time
 import tkinter as tk
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from tkinter import filedialog, messagebox, ttk
+from xml.etree import ElementTree
+
+# pandas, pyarrow and mapAlgorithmLibrary (numpy) are imported inside the
+# functions that use them, so the window appears without paying for them.
+
+
+def _importArrow():
+    """Return the pyarrow module with its IPC support, or None if it is not installed."""
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc
+    except ImportError:  # Arrow is optional; without it the table cache is disabled
+        return None
+    return pa
+
+
+# === Workbook Cache ===
+
+WORKBOOK_CACHE_SIZE = 8  # Max number of workbooks kept open at once
+
+_workbookCache = collections.OrderedDict()  # abspath -> ((abspath, mtime_ns, size), pd.ExcelFile)
+_workbookLock = threading.RLock()
+
+
+def _workbookKey(filePath):
+    stat = os.stat(filePath)
+    return (os.path.abspath(filePath), stat.st_mtime_ns, stat.st_size)
+
+
+def getWorkbook(filePath):
+    """
+    Return a shared pd.ExcelFile for a workbook, opening it only when needed.
+
+    Workbooks are cached by (path, mtime, size) with LRU eviction, so every
+    helper reading the same file reuses one parsed archive until the file
+    changes on disk. The file is read into memory once so no OS handle is
+    held open (SMEs can keep saving the workbook in Excel). Evicted or stale
+    workbooks are only dropped from the cache, never closed, because a
+    background reader may still be parsing them; garbage collection frees
+    them once the last reader is done.
+
+    Args:
+        filePath (str): Path to the Excel file.
+
+    Returns:
+        pd.ExcelFile: Open workbook.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    key = _workbookKey(filePath)
+    with _workbookLock:
+        entry = _workbookCache.get(key[0])
+        if entry is not None and entry[0] == key:
+            _workbookCache.move_to_end(key[0])
+            return entry[1]
+
+    import pandas as pd
+
+    with open(filePath, "rb") as f:
+        workbook = pd.ExcelFile(io.BytesIO(f.read()))
+
+    with _workbookLock:
+        _workbookCache.pop(key[0], None)
+        _workbookCache[key[0]] = (key, workbook)
+        while len(_workbookCache) > WORKBOOK_CACHE_SIZE:
+            _workbookCache.popitem(last=False)
+    return workbook
+
+
+def invalidateWorkbook(filePath=None):
+    """
+    Drop a workbook (or every workbook) from the cache.
+
+    Dropped workbooks are not closed; readers still holding one can finish.
+
+    Args:
+        filePath (str, optional): Workbook to drop; None clears the whole cache.
+    """
+    with _workbookLock:
+        if filePath is None:
+            _workbookCache.clear()
+        else:
+            _workbookCache.pop(os.path.abspath(filePath), None)
+
+
+# === Workbook Metadata ===
+
+_XLSX_NS = {
+    "main": "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
+    "rel": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "pkg": "http://schemas.openxmlformats.org/package/2006/relationships",
+}
+
+
+def _sheetPartPaths(archive):
+    """
+    Map sheet names to their worksheet XML part inside an open .xlsx archive.
+
+    Args:
+        archive (zipfile.ZipFile): Open workbook archive.
+
+    Returns:
+        Dict[str, str]: Sheet name -> part path (e.g. 'xl/worksheets/sheet1.xml'),
+        in workbook order.
+    """
+    workbookXml = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+    relsXml = ElementTree.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    targets = {}
+    for rel in relsXml.iterfind("pkg:Relationship", _XLSX_NS):
+        target = rel.get("Target", "")
+        targets[rel.get("Id")] = target.lstrip("/") if target.startswith("/") else "xl/" + target
+
+    parts = {}
+    for sheet in workbookXml.iterfind("main:sheets/main:sheet", _XLSX_NS):
+        parts[sheet.get("name")] = targets.get(sheet.get(f"{{{_XLSX_NS['rel']}}}id"), "")
+    return parts
+
+
+def readSheetNames(filePath):
+    """
+    Return sheet names by parsing only xl/workbook.xml inside the .xlsx zip.
+
+    Args:
+        filePath (str): Path to the .xlsx file.
+
+    Returns:
+        List[str]: Sheet names in workbook order.
+
+    Raises:
+        zipfile.BadZipFile, KeyError: If the file is not an .xlsx workbook.
+    """
+    with zipfile.ZipFile(filePath) as archive:
+        workbookXml = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+    return [sheet.get("name") for sheet in workbookXml.iterfind("main:sheets/main:sheet", _XLSX_NS)]
+
+
+def readSheetDimension(filePath, sheetName):
+    """
+    Return a sheet's used range from its <dimension ref>, without loading cells.
+
+    The worksheet part is streamed only until the dimension element (or the
+    start of the cell data if the writer left it out).
+
+    Args:
+        filePath (str): Path to the .xlsx file.
+        sheetName (str): Sheet to inspect.
+
+    Returns:
+        str | None: Range such as 'A1:N21', or None if the sheet has no
+        dimension element or does not exist.
+    """
+    with zipfile.ZipFile(filePath) as archive:
+        part = _sheetPartPaths(archive).get(sheetName)
+        if not part:
+            return None
+        with archive.open(part) as stream:
+            for _, element in ElementTree.iterparse(stream, events=("start",)):
+                tag = element.tag.rsplit("}", 1)[-1]
+                if tag == "dimension":
+                    return element.get("ref")
+                if tag == "sheetData":
+                    return None
+    return None
+
+
+# === Cheat Sheet Model ===
+
+class CheatSheet:
+    """
+    A cheat sheet parsed once and indexed by tab name.
+
+    A section is a "TabName,<name>" line, a "Filepath,<path>" line and its
+    entry lines, ending at the next blank line. Sections are indexed by
+    lower-cased tab name, so lookups are case-insensitive. Each section also
+    records its line range and the byte offset of its TabName line.
+
+    Instances are not changed after they are built. Use loadCheatSheet to get
+    the parsed form of a file; it is shared until the file changes on disk.
+    """
+
+    def __init__(self, path, text, encoding=None):
+        """
+        Args:
+            path (str): Cheat sheet path.
+            text (bytes): Raw file contents.
+            encoding (str, optional): Text encoding; defaults to the platform
+                default used by open().
+        """
+        self.path = path
+        self.encoding = encoding or locale.getpreferredencoding(False)
+        self.lines = []  # Raw lines, line endings kept
+        self.offsets = []  # Byte offset of each line
+        offset = 0
+        for rawLine in text.splitlines(keepends=True):
+            self.lines.append(rawLine.decode(self.encoding))
+            self.offsets.append(offset)
+            offset += len(rawLine)
+        firstLine = self.lines[0] if self.lines else ""
+        self.newline = "\r\n" if firstLine.endswith("\r\n") else "\n" if firstLine.endswith("\n") else os.linesep
+        self.sections = []
+        self._index = {}
+        self._parse()
+
+    def _parse(self):
+        stripped = [line.strip() for line in self.lines]
+        i = 0
+        while i < len(stripped):
+            if not stripped[i].startswith("TabName"):
+                i += 1
+                continue
+            start = i
+            name = stripped[i].split(",", 1)[1].strip() if "," in stripped[i] else ""
+            filePathLine = stripped[i + 1] if i + 1 < len(stripped) else ""
+            filePath = filePathLine.split(",", 1)[1].strip() if "," in filePathLine else ""
+
+            i += 2
+            while i < len(stripped) and stripped[i] != "":
+                i += 1
+
+            section = {
+                "name": name,
+                "filepath": filePath,
+                "start": start,
+                "end": min(i, len(stripped)),
+                "offset": self.offsets[start],
+                "lines": stripped[start + 2:i],
+            }
+            self.sections.append(section)
+            self._index.setdefault(name.lower(), section)
+
+    def __len__(self):
+        return len(self.sections)
+
+    def __contains__(self, tabName):
+        return self.section(tabName) is not None
+
+    def section(self, tabName):
+        """
+        Find a tab's section.
+
+        Args:
+            tabName (str): Tab name (any case).
+
+        Returns:
+            Dict or None: Keys name, filepath, start/end (line range, end
+            exclusive), offset (byte offset of the TabName line) and lines
+            (stripped lines after the two header lines).
+        """
+        key = tabName.lower()
+        section = self._index.get(key)
+        if section is None:
+            # Same prefix match as the original "tabname,<name>" scan
+            section = next((s for s in self.sections if s["name"].lower().startswith(key)), None)
+        return section
+
+    def sectionLines(self, tabName):
+        """
+        Args:
+            tabName (str): Tab name (any case).
+
+        Returns:
+            List[str]: Stripped lines of the tab's section after its two header lines.
+        """
+        section = self.section(tabName)
+        return list(section["lines"]) if section is not None else []
+
+    def tabs(self):
+        """
+        Returns:
+            List[Dict]: Fresh parseCheatSheet-style tab dicts, in file order.
+        """
+        tabs = []
+        for section in self.sections:
+            entries = []
+            for line in section["lines"]:
+                parts = [p.strip() for p in line.split(",")]
+                if len(parts) >= 2:
+                    entries.append({
+                        "displayName": parts[0],
+                        "sheetName": parts[1],
+                        "startRow": parts[2] if len(parts) > 2 else "",
+                        "columns": parts[3] if len(parts) > 3 else ""
+                    })
+            tabs.append({"name": section["name"], "filepath": section["filepath"], "entries": entries})
+        return tabs
+
+    def withSections(self, sectionLines):
+        """
+        Return the file text with some tabs' entry lines replaced.
+
+        Each tab keeps its TabName/Filepath header lines and stays followed
+        by a blank separator line.
+
+        Args:
+            sectionLines (Dict[str, List[str]]): Tab name (any case) -> new
+                entry lines, without line endings.
+
+        Returns:
+            str: Complete new file text.
+
+        Raises:
+            KeyError: If a tab is not in the cheat sheet.
+        """
+        replacements = []
+        for tabName, bodyLines in sectionLines.items():
+            section = self.section(tabName)
+            if section is None:
+                raise KeyError(tabName)
+            replacements.append((section["start"], section["end"], bodyLines))
+
+        lines = list(self.lines)
+        for start, end, bodyLines in sorted(replacements, reverse=True):
+            header = lines[start:start + 2]
+            if header and not header[-1].endswith(("\n", "\r")):
+                header[-1] += self.newline
+            separator = [] if end < len(lines) and not lines[end].strip() else [self.newline]
+            lines[start:end] = header + [line + self.newline for line in bodyLines] + separator
+        return "".join(lines)
+
+
+_cheatSheetCache = {}  # abspath -> ((abspath, mtime_ns, size), CheatSheet)
+_cheatSheetLock = threading.Lock()
+
+
+def loadCheatSheet(cheatSheetPath):
+    """
+    Return the parsed CheatSheet for a file, parsing it only when it changed.
+
+    Args:
+        cheatSheetPath (str): Path to cheat sheet text file.
+
+    Returns:
+        CheatSheet: Parsed cheat sheet (shared; do not modify).
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    key = _workbookKey(cheatSheetPath)
+    with _cheatSheetLock:
+        entry = _cheatSheetCache.get(key[0])
+        if entry is not None and entry[0] == key:
+            return entry[1]
+
+    with open(cheatSheetPath, "rb") as f:
+        cheatSheet = CheatSheet(cheatSheetPath, f.read())
+
+    with _cheatSheetLock:
+        _cheatSheetCache[key[0]] = (key, cheatSheet)
+    return cheatSheet
+
+
+def invalidateCheatSheet(cheatSheetPath=None):
+    """
+    Drop a parsed cheat sheet (or all of them) so the next load re-reads the file.
+
+    Args:
+        cheatSheetPath (str, optional): Cheat sheet to drop; None clears every entry.
+    """
+    with _cheatSheetLock:
+        if cheatSheetPath is None:
+            _cheatSheetCache.clear()
+        else:
+            _cheatSheetCache.pop(os.path.abspath(cheatSheetPath), None)
+
+
+# === Cheat Sheet Writes ===
+
+CHEAT_SHEET_WRITE_DELAY_MS = 500  # Edits staged within this window are written together
+CHEAT_SHEET_JOURNAL_MAX_BYTES = 1 << 20  # Journal is discarded after a write once it grows past this
+
+
+def cheatSheetJournalPath(cheatSheetPath):
+    """
+    Args:
+        cheatSheetPath (str): Cheat sheet path.
+
+    Returns:
+        str: Path of the cheat sheet's edit journal.
+    """
+    return os.path.abspath(cheatSheetPath) + ".journal"
+
+
+def _appendJournal(cheatSheetPath, record):
+    """Append one record to a cheat sheet journal and flush it to disk."""
+    with open(cheatSheetJournalPath(cheatSheetPath), "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _unflushedJournalRecords(cheatSheetPath):
+    """Return journal records staged after the last completed write."""
+    journalPath = cheatSheetJournalPath(cheatSheetPath)
+    if not os.path.isfile(journalPath):
+        return []
+    records = []
+    with open(journalPath, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Torn last line from a crash mid-append
+            if record.get("flushed"):
+                records = []
+            else:
+                records.append(record)
+    return records
+
+
+def _writeTextAtomic(path, text, encoding):
+    """Write text to a temp file next to path, fsync it and swap it into place (keeping path's mode)."""
+    dirName = os.path.dirname(os.path.abspath(path))
+    with tempfile.NamedTemporaryFile("w", dir=dirName, encoding=encoding, newline="", delete=False) as tmpFile:
+        tmpFile.write(text)
+        tmpFile.flush()
+        os.fsync(tmpFile.fileno())
+        tempName = tmpFile.name
+    try:
+        if os.path.exists(path):
+            shutil.copymode(path, tempName)  # NamedTemporaryFile is 0600; keep a shared sheet readable
+        os.replace(tempName, path)
+    except OSError:
+        os.remove(tempName)
+        raise
+
+
+def _applyCheatSheetRecords(cheatSheetPath, records):
+    """
+    Apply staged records to a cheat sheet with a single atomic replace.
+
+    Records are {"text": <whole file>} or {"tab": <name>, "lines": [...]},
+    in staging order. Whole-file text uses "\n" line endings and is written
+    with the file's own line ending.
+
+    Returns:
+        List[str]: Names of the tabs whose sections were replaced.
+    """
+    if os.path.isfile(cheatSheetPath):
+        current = loadCheatSheet(cheatSheetPath)
+        text, encoding, newline = "".join(current.lines), current.encoding, current.newline
+    else:
+        text, encoding, newline = "", locale.getpreferredencoding(False), os.linesep
+
+    sectionLines = {}
+    for record in records:
+        if "text" in record:
+            text = record["text"].replace("\n", newline)
+            sectionLines = {}  # Earlier section edits are replaced by the whole-file text
+        else:
+            sectionLines.pop(record["tab"].lower(), None)
+            sectionLines[record["tab"].lower()] = (record["tab"], record["lines"])
+
+    written = []
+    if sectionLines:
+        cheatSheet = CheatSheet(cheatSheetPath, text.encode(encoding), encoding)
+        edits = {}
+        for tabName, lines in sectionLines.values():
+            if tabName in cheatSheet:
+                edits[tabName] = lines
+                written.append(tabName)
+            else:
+                print(f"Skipping cheat sheet update for missing tab '{tabName}'")
+        text = cheatSheet.withSections(edits)
+
+    _writeTextAtomic(cheatSheetPath, text, encoding)
+    invalidateCheatSheet(cheatSheetPath)
+    return written
+
+
+def _finishJournal(cheatSheetPath):
+    """Mark staged records as written and drop the journal once it is large."""
+    _appendJournal(cheatSheetPath, {"flushed": True})
+    journalPath = cheatSheetJournalPath(cheatSheetPath)
+    try:
+        if os.path.getsize(journalPath) > CHEAT_SHEET_JOURNAL_MAX_BYTES:
+            os.remove(journalPath)
+    except OSError:
+        pass
+
+
+def unsavedCheatSheetEdits(cheatSheetPath):
+    """
+    Count cheat sheet edits that were journaled but never written.
+
+    Args:
+        cheatSheetPath (str): Cheat sheet path.
+
+    Returns:
+        int: Number of records recoverCheatSheet would re-apply.
+    """
+    return len(_unflushedJournalRecords(cheatSheetPath))
+
+
+def recoverCheatSheet(cheatSheetPath):
+    """
+    Re-apply cheat sheet edits that were journaled but never written.
+
+    Call before reading the cheat sheet at start-up. Edits staged before a
+    crash (or before the app closed mid-write) are applied with one atomic
+    replace.
+
+    Args:
+        cheatSheetPath (str): Cheat sheet path.
+
+    Returns:
+        int: Number of recovered records (0 if there was nothing to do).
+    """
+    records = _unflushedJournalRecords(cheatSheetPath)
+    if records:
+        _applyCheatSheetRecords(cheatSheetPath, records)
+        _finishJournal(cheatSheetPath)
+        print(f"Recovered {len(records)} unsaved cheat sheet edit(s) from {cheatSheetJournalPath(cheatSheetPath)}")
+    return len(records)
+
+
+class CheatSheetWriter:
+    """
+    The single write path for cheat sheet files.
+
+    Edits are staged (and journaled immediately) and then written together:
+    everything staged for a file within delayMs of the last edit becomes one
+    atomic replace, so clicking "Update Cheat Sheet" on ten tabs rewrites the
+    file once. Without an attached Tk root, every stage is written straight
+    away.
+    """
+
+    def __init__(self, root=None, delayMs=CHEAT_SHEET_WRITE_DELAY_MS, onFlushed=None, onError=None, onWritten=None):
+        """
+        Args:
+            root (tk.Tk, optional): Root window used to schedule debounced writes.
+            delayMs (int): Debounce window in milliseconds.
+            onFlushed (Callable[[str, List[str]], None], optional): Called with the
+                path and updated tab names after each section write.
+            onError (Callable[[str, Exception], None], optional): Called when a
+                write fails; the edits stay staged and in the journal.
+            onWritten (Callable[[str], None], optional): Called with the path after
+                every successful write, e.g. so a FileWatcher can ignore it.
+        """
+        self.root = root
+        self.delayMs = delayMs
+        self.onFlushed = onFlushed
+        self.onError = onError
+        self.onWritten = onWritten
+        self._pending = collections.OrderedDict()  # abspath -> [record, ...]
+        self._afterId = None
+        self._lock = threading.RLock()
+
+    def attach(self, root):
+        """Debounce writes on root's event loop from now on."""
+        self.root = root
+
+    def stageSection(self, cheatSheetPath, tabName, bodyLines):
+        """
+        Stage new entry lines for one tab.
+
+        Args:
+            cheatSheetPath (str): Cheat sheet path.
+            tabName (str): Tab to replace.
+            bodyLines (List[str]): New entry lines, without line endings.
+        """
+        self._stage(cheatSheetPath, {"tab": tabName, "lines": list(bodyLines)})
+
+    def stageText(self, cheatSheetPath, text):
+        """
+        Stage a whole-file replacement (replaces edits staged before it).
+
+        Args:
+            cheatSheetPath (str): Cheat sheet path.
+            text (str): New file text with "\n" line endings.
+        """
+        self._stage(cheatSheetPath, {"text": text})
+
+    def _stage(self, cheatSheetPath, record):
+        with self._lock:
+            _appendJournal(cheatSheetPath, record)
+            self._pending.setdefault(os.path.abspath(cheatSheetPath), []).append(record)
+        self._schedule()
+
+    def _schedule(self):
+        if self.root is None:
+            self.flush()
+            return
+        try:
+            if self._afterId is not None:
+                self.root.after_cancel(self._afterId)
+            self._afterId = self.root.after(self.delayMs, self.flush)
+        except tk.TclError:  # Root already destroyed
+            self.flush()
+
+    def flush(self):
+        """
+        Write every staged edit now, one atomic replace per file.
+
+        Returns:
+            bool: True if everything was written.
+        """
+        with self._lock:
+            if self._afterId is not None and self.root is not None:
+                try:
+                    self.root.after_cancel(self._afterId)
+                except tk.TclError:
+                    pass
+            self._afterId = None
+            pending, self._pending = self._pending, collections.OrderedDict()
+
+            ok = True
+            for cheatSheetPath, records in pending.items():
+                try:
+                    written = _applyCheatSheetRecords(cheatSheetPath, records)
+                    _finishJournal(cheatSheetPath)
+                except Exception as e:
+                    ok = False
+                    # Keep the records ahead of anything staged since, so the next
+                    # flush's "flushed" marker only ever covers edits that were written
+                    self._pending.setdefault(cheatSheetPath, [])[:0] = records
+                    if self.onError is not None:
+                        self.onError(cheatSheetPath, e)
+                    else:
+                        print(f"Failed to write cheat sheet {cheatSheetPath}: {e}")
+                    continue
+                if self.onWritten is not None:
+                    self.onWritten(cheatSheetPath)
+                if written and self.onFlushed is not None:
+                    self.onFlushed(cheatSheetPath, written)
+            return ok
+
+
+def _reportCheatSheetFlush(cheatSheetPath, tabNames):
+    tabList = ", ".join(f"'{name}'" for name in tabNames)
+    messagebox.showinfo("Success", f"Cheat sheet updated for tab{'s' if len(tabNames) > 1 else ''} {tabList}.")
+
+
+def _reportCheatSheetError(cheatSheetPath, error):
+    messagebox.showerror("Error", f"Failed to update cheat sheet:\n{error}\n\n"
+                                  "Your edits are journaled and will be re-applied on the next start.")
+
+
+cheatSheetWriter = CheatSheetWriter(onFlushed=_reportCheatSheetFlush, onError=_reportCheatSheetError)
+
+
+# === Entry Table ===
+
+ENTRY_TABLE_COLUMNS = ("displayName", "sheet", "startRow", "columns")
+ENTRY_TABLE_HEADINGS = {"displayName": "Entry", "sheet": "Sheet", "startRow": "Starting Row", "columns": "Columns"}
+ENTRY_TABLE_WIDTHS = {"displayName": 220, "sheet": 240, "startRow": 100, "columns": 100}
+
+
+class TreeCellVar:
+    """StringVar-like view of one Treeview cell, so callers can keep using .get()/.set()."""
+
+    def __init__(self, tree, rowId, column):
+        self.tree = tree
+        self.rowId = rowId
+        self.column = column
+
+    def get(self):
+        return self.tree.set(self.rowId, self.column)
+
+    def set(self, value):
+        self.tree.set(self.rowId, self.column, value)
+
+
+class EntryTable:
+    """
+    Editable table of cheat sheet entries backed by a ttk.Treeview.
+
+    The Treeview only draws the rows in view, and cells are edited in place
+    with one shared Combobox (Sheet) or Entry (Starting Row, Columns) laid
+    over the cell, so a tab costs the same few widgets however many entries
+    it has. Starting Row/Columns visibility is a single displaycolumns change.
+    """
+
+    def __init__(self, parent, sheetNames, showStartCols=False, height=20):
+        """
+        Args:
+            parent (tk.Widget): Container for the table.
+            sheetNames (List[str]): Choices for the Sheet column.
+            showStartCols (bool): If True, show the Starting Row and Columns columns.
+            height (int): Rows shown before scrolling.
+        """
+        self.sheetNames = list(sheetNames)
+        self.frame = ttk.Frame(parent)
+
+        self.tree = ttk.Treeview(self.frame, columns=ENTRY_TABLE_COLUMNS, show="headings",
+                                 height=height, selectmode="browse")
+        for column in ENTRY_TABLE_COLUMNS:
+            self.tree.heading(column, text=ENTRY_TABLE_HEADINGS[column], anchor="w")
+            self.tree.column(column, width=ENTRY_TABLE_WIDTHS[column],
+                             stretch=column in ("displayName", "sheet"), anchor="w")
+
+        scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self.tree.yview)
+        self._scrollbar = scrollbar
+        self._view = None  # Last (first, last) scroll fractions
+        self.tree.configure(yscrollcommand=self._onScroll)
+        scrollbar.pack(side="right", fill="y")
+        self.tree.pack(side="left", fill="both", expand=True)
+
+        self._editor = None  # (widget, rowId, column) while a cell is being edited
+        self._comboEditor = None
+        self._textEditor = None
+        self.tree.bind("<Double-1>", self._onDoubleClick)
+        self.tree.bind("<Button-1>", lambda event: self.endEdit(), add="+")
+        self.tree.bind("<Return>", self._onReturn)
+        self.tree.bind("<Configure>", lambda event: self.endEdit())
+        self.showStartCols(showStartCols)
+
+    def addRow(self, displayName, sheet, startRow, columns):
+        """
+        Append an entry row.
+
+        Returns:
+            Dict: Entry with displayName and selectedSheetVar/startRowVar/columnsVar
+            (TreeCellVar) for the row.
+        """
+        rowId = self.tree.insert("", "end", values=(displayName, sheet, startRow, columns))
+        return {
+            "displayName": displayName,
+            "selectedSheetVar": TreeCellVar(self.tree, rowId, "sheet"),
+            "startRowVar": TreeCellVar(self.tree, rowId, "startRow"),
+            "columnsVar": TreeCellVar(self.tree, rowId, "columns")
+        }
+
+    def showStartCols(self, show):
+        """Show or hide the Starting Row and Columns columns."""
+        self.endEdit()
+        self._displayColumns = list(ENTRY_TABLE_COLUMNS if show else ENTRY_TABLE_COLUMNS[:2])
+        self.tree.configure(displaycolumns=self._displayColumns)
+
+    def _onScroll(self, first, last):
+        self._scrollbar.set(first, last)
+        if (first, last) != self._view:
+            self._view = (first, last)
+            self.endEdit()  # The edited cell moved
+
+    def _onDoubleClick(self, event):
+        if self.tree.identify_region(event.x, event.y) != "cell":
+            return
+        rowId = self.tree.identify_row(event.y)
+        displayIndex = int(self.tree.identify_column(event.x)[1:]) - 1
+        if rowId and 0 <= displayIndex < len(self._displayColumns):
+            self.beginEdit(rowId, self._displayColumns[displayIndex])
+
+    def _onReturn(self, event):
+        rowId = self.tree.focus()
+        if rowId:
+            self.beginEdit(rowId, "sheet")
+
+    def beginEdit(self, rowId, column):
+        """
+        Open the in-place editor over one cell (the Entry column is read-only).
+
+        Args:
+            rowId (str): Treeview item ID.
+            column (str): Column name.
+        """
+        self.endEdit()
+        if column == "displayName" or column not in self._displayColumns:
+            return
+        self.tree.see(rowId)
+        bbox = self.tree.bbox(rowId, column)
+        if not bbox:
+            return
+        x, y, width, height = bbox
+        value = self.tree.set(rowId, column)
+
+        if column == "sheet":
+            if self._comboEditor is None:
+                self._comboEditor = ttk.Combobox(self.tree, state="readonly")
+                self._comboEditor.bind("<<ComboboxSelected>>", lambda event: self.endEdit(refocus=True))
+                # No <FocusOut>: opening the dropdown list takes focus from the Combobox
+                self._bindEditorKeys(self._comboEditor)
+            editor = self._comboEditor
+            editor.configure(values=self.sheetNames)
+            editor.set(value)
+        else:
+            if self._textEditor is None:
+                self._textEditor = ttk.Entry(self.tree)
+                self._textEditor.bind("<FocusOut>", lambda event: self.endEdit())
+                self._bindEditorKeys(self._textEditor)
+            editor = self._textEditor
+            editor.delete(0, "end")
+            editor.insert(0, value)
+            editor.select_range(0, "end")
+
+        self._editor = (editor, rowId, column)
+        editor.place(x=x, y=y, width=width, height=height)
+        editor.focus_set()
+
+    def _bindEditorKeys(self, editor):
+        editor.bind("<Return>", lambda event: self.endEdit(refocus=True))
+        editor.bind("<KP_Enter>", lambda event: self.endEdit(refocus=True))
+        editor.bind("<Escape>", lambda event: self.endEdit(commit=False, refocus=True))
+
+    def endEdit(self, commit=True, refocus=False):
+        """
+        Close the in-place editor.
+
+        Args:
+            commit (bool): Save the editor's value into the cell.
+            refocus (bool): Return keyboard focus to the table.
+        """
+        if self._editor is None:
+            return
+        editor, rowId, column = self._editor
+        self._editor = None
+        if commit and self.tree.exists(rowId):
+            self.tree.set(rowId, column, editor.get().strip())
+        editor.place_forget()
+        if refocus:
+            self.tree.focus_set()
 
-import pandas as pd
-import openpyxl
 
 # === Excel Helpers ===
 
 def getExcelSheetNames(filePath):
     """
     Return all sheet names from an Excel file.
+
+    Reads only the workbook metadata for .xlsx files; other formats fall back
+    to the shared workbook cache.
     
     Args:
         filePath (str): Path to the Excel file.
@@ -26,8 +851,10 @@ def getExcelSheetNames(filePath):
         List[str]: List of sheet names, or empty list if file read fails.
     """
     try:
-        xls = pd.ExcelFile(filePath)
-        return xls.sheet_names
+        try:
+            return readSheetNames(filePath)
+        except (zipfile.BadZipFile, KeyError):
+            return list(getWorkbook(filePath).sheet_names)
     except Exception as e:
         print(f"Error reading Excel file: {e}")
         return []
@@ -44,37 +871,14 @@ def getSectionLines(cheatSheetPath, tabName):
     Returns:
         List[str]: Lines for the tab section, excluding the first 2 header lines.
     """
-    with open(cheatSheetPath, "r") as f:
-        lines = [line.strip() for line in f]
-
-    sectionStart = None
-    sectionEnd = None
-
-    # Find the start index for the tab section
-    for i, line in enumerate(lines):
-        if line.lower().startswith(f"tabname,{tabName.lower()}"):
-            sectionStart = i
-            break
-
-    if sectionStart is None:
-        return []
-
-    # Find the end index for the section (next blank line or EOF)
-    for j in range(sectionStart + 1, len(lines)):
-        if lines[j] == "":
-            sectionEnd = j
-            break
-    if sectionEnd is None:
-        sectionEnd = len(lines)
-
-    # Return lines after the two-line header for this tab section
-    return lines[sectionStart + 2 : sectionEnd]
+    return loadCheatSheet(cheatSheetPath).sectionLines(tabName)
 
 
 def updateCheatSheetForTab(tabName, cheatSheetPath, tabEntries):
     """
     Update cheat sheet section for a specific tab with new dropdown selections.
-    Overwrites the section in the cheat sheet file.
+    The edit is staged on cheatSheetWriter, which writes it together with
+    other tabs' updates made in the same moment.
     
     Args:
         tabName (str): Tab to update.
@@ -82,59 +886,27 @@ def updateCheatSheetForTab(tabName, cheatSheetPath, tabEntries):
         tabEntries (List[Dict]): List of entries with 'displayName' and 'selectedSheetVar'.
     
     Side Effects:
-        Writes updated cheat sheet file in-place.
-        Shows success or error messagebox.
+        Journals the edit and schedules the cheat sheet write.
+        Shows success or error messagebox once written.
     """
     try:
-        with open(cheatSheetPath, "r") as f:
-            lines = f.readlines()
-
-        startIdx = None
-        endIdx = None
-
-        # Locate section start index for tab
-        for i, line in enumerate(lines):
-            if line.lower().startswith(f"tabname,{tabName.lower()}"):
-                startIdx = i
-                break
-
-        if startIdx is None:
+        if tabName not in loadCheatSheet(cheatSheetPath):
             messagebox.showerror("Error", f"Tab '{tabName}' not found in cheat sheet.")
             return
 
-        # Locate section end index (next blank line)
-        for j in range(startIdx + 1, len(lines)):
-            if lines[j].strip() == "":
-                endIdx = j
-                break
-        if endIdx is None:
-            endIdx = len(lines)
-
-        # Build new section lines: header + updated tab entries
-        newSection = lines[startIdx : startIdx + 2]
-        for entry in tabEntries:
-            display = entry["displayName"]
-            sheet = entry["selectedSheetVar"].get()
-            newSection.append(f"{display},{sheet}\n")
-        newSection.append("\n")
-
-        # Replace old section with new content
-        lines = lines[:startIdx] + newSection + lines[endIdx:]
-
-        # Write updated cheat sheet back to file
-        with open(cheatSheetPath, "w") as f:
-            f.writelines(lines)
-
-        messagebox.showinfo("Success", f"Cheat sheet updated for tab '{tabName}'.")
+        # Replace the tab's entry lines, keeping its TabName/Filepath header
+        bodyLines = [f"{entry['displayName']},{entry['selectedSheetVar'].get()}" for entry in tabEntries]
+        cheatSheetWriter.stageSection(cheatSheetPath, tabName, bodyLines)
 
     except Exception as e:
         messagebox.showerror("Error", f"Failed to update cheat sheet:\n{e}")
 
 
-def populateTabFromCheatSheet(tabFrame, excelFilePath, cheatSheetPath, tabName, showStartCols=False):
+def populateTabFromCheatSheet(tabFrame, excelFilePath, cheatSheetPath, tabName, showStartCols=False,
+                              sheetNames=None, sectionLines=None):
     """
-    Populate a tkinter tab frame with dropdowns based on cheat sheet data,
-    including optional Start Row and Columns inputs.
+    Populate a tkinter tab frame with an editable EntryTable of cheat sheet
+    data, including optional Start Row and Columns columns.
     
     Args:
         tabFrame (tk.Frame): UI frame to populate.
@@ -142,14 +914,22 @@ def populateTabFromCheatSheet(tabFrame, excelFilePath, cheatSheetPath, tabName,
         cheatSheetPath (str): Path to cheat sheet text file.
         tabName (str): Current tab name.
         showStartCols (bool): If True, display Start Row and Columns inputs.
+        sheetNames (List[str], optional): Sheet names already read (see readTabSources).
+        sectionLines (List[str], optional): Cheat sheet section already read.
     
     Side Effects:
-        Populates tabFrame with widgets and stores references in tabFrame.entries.
+        Populates tabFrame with widgets and stores per-row cell variables in tabFrame.entries.
     """
-    sheetNames = getExcelSheetNames(excelFilePath)
-    sectionLines = getSectionLines(cheatSheetPath, tabName)
+    if sheetNames is None:
+        sheetNames = getExcelSheetNames(excelFilePath)
+    if sectionLines is None:
+        sectionLines = getSectionLines(cheatSheetPath, tabName)
     tabFrame.entries = []  # Store entry references for updating cheat sheet
-    tabFrame.startColsWidgets = []  # Store widgets for toggling visibility
+
+    entryTable = EntryTable(tabFrame, sheetNames, showStartCols)
+    entryTable.frame.pack(fill="both", expand=True, pady=2, padx=10)
+    tabFrame.entryTable = entryTable  # Toggled by toggleStartColsVisibility
+    tabFrame.populatedWidgets = [entryTable.frame]  # Top-level widgets added here, destroyed by rebuildTab
 
     for line in sectionLines:
         if not line.strip():
@@ -161,59 +941,197 @@ def populateTabFromCheatSheet(tabFrame, excelFilePath, cheatSheetPath, tabName,
         startRowVal = parts[2] if len(parts) > 2 else "1"
         columnsVal = parts[3] if len(parts) > 3 else "A:Z"
 
-        rowFrame = ttk.Frame(tabFrame)
-        rowFrame.pack(fill="x", pady=2, padx=10)
-
-        # Label for the entry
-        ttk.Label(rowFrame, text=displayName, width=25).pack(side="left")
-
-        # Dropdown combobox for sheet selection
-        defaultSheet = sheetNames[0] if sheetNames else ""
-        selectedValue = sheetName if sheetName in sheetNames else defaultSheet
-        selectedSheet = tk.StringVar(value=selectedValue)
-        dropdown = ttk.Combobox(rowFrame, textvariable=selectedSheet,
-                                values=sheetNames, state="readonly", width=30)
-        dropdown.pack(side="left", padx=5)
-
-        # Start Row widgets
-        startRowLabel = ttk.Label(rowFrame, text="Starting Row:", width=12)
-        startRowVar = tk.StringVar(value=startRowVal)
-        startRowEntry = ttk.Entry(rowFrame, textvariable=startRowVar, width=8)
-
-        # Columns widgets
-        columnsLabel = ttk.Label(rowFrame, text="Columns:", width=10)
-        columnsVar = tk.StringVar(value=columnsVal)
-        columnsEntry = ttk.Entry(rowFrame, textvariable=columnsVar, width=10)
-
-        # Show or hide Start Row and Columns widgets based on flag
-        if showStartCols:
-            startRowLabel.pack(side="left", padx=2)
-            startRowEntry.pack(side="left", padx=2)
-            columnsLabel.pack(side="left", padx=2)
-            columnsEntry.pack(side="left", padx=2)
-
-        # Save references for toggling visibility and saving data
-        tabFrame.entries.append({
-            "displayName": displayName,
-            "selectedSheetVar": selectedSheet,
-            "startRowVar": startRowVar,
-            "columnsVar": columnsVar
-        })
-
-        tabFrame.startColsWidgets.append({
-            "startRowLabel": startRowLabel,
-            "startRowEntry": startRowEntry,
-            "columnsLabel": columnsLabel,
-            "columnsEntry": columnsEntry
-        })
+        selectedValue = resolveSheetName(sheetName, sheetNames)
+        tabFrame.entries.append(entryTable.addRow(displayName, selectedValue, startRowVal, columnsVal))
 
     # Add update button at bottom of tab
     updateButton = tk.Button(
         tabFrame,
         text="Update Cheat Sheet",
-        command=lambda: updateCheatSheetForTab(tabName, cheatSheetPath, tabFrame.entries)
+        command=lambda: (entryTable.endEdit(), updateCheatSheetForTab(tabName, cheatSheetPath, tabFrame.entries))
     )
-    updateButton.pack(side="bottom", pady=10)
+    updateButton.pack(side="bottom", pady=10, before=entryTable.frame)
+    tabFrame.populatedWidgets.append(updateButton)
+
+
+def rebuildTab(tabFrame, excelFilePath, cheatSheetPath, tabName, showStartCols=False, loader=None):
+    """
+    Rebuild one tab's cheat sheet rows in place, keeping its adjudication toggle.
+
+    With a loader, the workbook and cheat sheet reads run in the background
+    and the old rows stay on screen until the new ones are ready; if the tab
+    is rebuilt again meanwhile, only the latest rebuild is applied.
+
+    Args:
+        tabFrame (tk.Frame): Tab previously filled by populateTabFromCheatSheet.
+        excelFilePath (str): Path to Excel file to get sheet names.
+        cheatSheetPath (str): Path to cheat sheet text file.
+        tabName (str): Tab name.
+        showStartCols (bool): If True, display Start Row and Columns inputs.
+        loader (BackgroundLoader, optional): Loader for the disk reads.
+    """
+    tabFrame.rebuildGeneration = generation = getattr(tabFrame, "rebuildGeneration", 0) + 1
+
+    def build(sources):
+        if tabFrame.rebuildGeneration != generation:
+            return  # Superseded by a later rebuild
+        for widget in getattr(tabFrame, "populatedWidgets", []):
+            widget.destroy()
+        sheetNames, sectionLines = sources if sources is not None else (None, None)
+        populateTabFromCheatSheet(tabFrame, excelFilePath, cheatSheetPath, tabName, showStartCols,
+                                  sheetNames, sectionLines)
+
+    if loader is None:
+        build(None)
+        return
+    loader.submit(
+        readTabSources, excelFilePath, cheatSheetPath, tabName,
+        onDone=build,
+        onError=lambda error: print(f"Error reloading tab '{tabName}': {error}")
+    )
+
+
+def readTabSources(excelFilePath, cheatSheetPath, tabName):
+    """
+    Read everything populateTabFromCheatSheet needs from disk (safe off the Tk thread).
+
+    Args:
+        excelFilePath (str): Path to Excel file to get sheet names.
+        cheatSheetPath (str): Path to cheat sheet text file.
+        tabName (str): Tab name.
+
+    Returns:
+        Tuple[List[str], List[str]]: Sheet names and cheat sheet section lines.
+    """
+    return getExcelSheetNames(excelFilePath), getSectionLines(cheatSheetPath, tabName)
+
+
+def ensureTabPopulated(tabFrame, cheatSheetPath, showStartCols=False, loader=None):
+    """
+    Build a lazily created tab the first time it is selected.
+
+    Tabs created with a pendingTab attribute (the parsed cheat sheet dict for
+    the tab) and an optional placeholder widget are populated here on demand.
+    With a loader, the workbook and cheat sheet reads run in the background
+    and the tab is built when they finish; until then the tab keeps its
+    placeholder and pendingTab data. If reloadChangedTabs replaces pendingTab
+    while the reads are in flight, their result is dropped and the load
+    starts again from the new data.
+
+    Args:
+        tabFrame (tk.Frame): Selected tab frame.
+        cheatSheetPath (str): Path to cheat sheet text file.
+        showStartCols (bool): If True, display Start Row and Columns inputs.
+        loader (BackgroundLoader, optional): Loader for the disk reads.
+
+    Returns:
+        bool: True if the tab was built (or its load started) by this call.
+    """
+    pendingTab = getattr(tabFrame, "pendingTab", None)
+    if pendingTab is None or getattr(tabFrame, "loading", False):
+        return False
+
+    def build(sources):
+        tabFrame.loading = False
+        if tabFrame.pendingTab is not pendingTab:
+            if tabFrame.pendingTab is not None:  # Replaced mid-load; read the new path and rows
+                ensureTabPopulated(tabFrame, getattr(tabFrame, "pendingCheatSheetPath", cheatSheetPath),
+                                   showStartCols, loader)
+            return
+        tabFrame.pendingTab = None
+        placeholder = getattr(tabFrame, "placeholder", None)
+        if placeholder is not None:
+            placeholder.destroy()
+            tabFrame.placeholder = None
+        sheetNames, sectionLines = sources if sources is not None else (None, None)
+        populateTabFromCheatSheet(tabFrame, pendingTab["filepath"], cheatSheetPath, pendingTab["name"],
+                                  showStartCols, sheetNames, sectionLines)
+
+    if loader is None:
+        build(None)
+        return True
+
+    def failed(error):
+        tabFrame.loading = False
+        print(f"Error loading tab '{pendingTab['name']}': {error}")
+
+    tabFrame.loading = True
+    loader.submit(
+        readTabSources, pendingTab["filepath"], cheatSheetPath, pendingTab["name"],
+        onDone=build,
+        onError=failed,
+        onCancel=lambda: setattr(tabFrame, "loading", False)
+    )
+    return True
+
+
+def getTabEntryValues(tabFrame):
+    """
+    Return a tab's current row values from its widgets, or from the parsed
+    cheat sheet data if the tab has not been built yet.
+
+    Args:
+        tabFrame (tk.Frame): Tab frame.
+
+    Returns:
+        List[Dict] | None: Dicts with displayName, sheet, startRow and columns
+        strings, or None for tabs without cheat sheet rows (e.g. Home).
+    """
+    if hasattr(tabFrame, "entries"):
+        return [{
+            "displayName": entry["displayName"],
+            "sheet": entry["selectedSheetVar"].get(),
+            "startRow": entry["startRowVar"].get(),
+            "columns": entry["columnsVar"].get()
+        } for entry in tabFrame.entries]
+
+    pendingTab = getattr(tabFrame, "pendingTab", None)
+    if pendingTab is not None:
+        return tabDataEntryValues(pendingTab)
+    return None
+
+
+def resolveSheetName(sheetName, sheetNames):
+    """
+    Return the sheet a cheat sheet entry selects in its workbook.
+
+    Args:
+        sheetName (str): Sheet named in the cheat sheet.
+        sheetNames (List[str]): Sheets in the workbook.
+
+    Returns:
+        str: sheetName if the workbook has it, else the first sheet ("" if none).
+    """
+    if sheetName in sheetNames:
+        return sheetName
+    return sheetNames[0] if sheetNames else ""
+
+
+def tabDataEntryValues(tab, sheetNames=None):
+    """
+    Return a parsed cheat sheet tab's rows in getTabEntryValues form.
+
+    Sheet names the workbook does not have fall back to its first sheet,
+    exactly as they do when the tab is built, so a tab's values do not
+    depend on whether it was opened.
+
+    Args:
+        tab (Dict): One parseCheatSheet tab.
+        sheetNames (List[str], optional): The workbook's sheets; read from
+            tab["filepath"] if omitted.
+
+    Returns:
+        List[Dict]: Dicts with displayName, sheet, startRow and columns strings.
+    """
+    if sheetNames is None:
+        sheetNames = getExcelSheetNames(tab["filepath"])
+    # Same defaults populateTabFromCheatSheet applies to short lines
+    return [{
+        "displayName": entry["displayName"],
+        "sheet": resolveSheetName(entry["sheetName"], sheetNames),
+        "startRow": entry["startRow"] or "1",
+        "columns": entry["columns"] or "A:Z"
+    } for entry in tab["entries"]]
 
 
 def toggleStartColsVisibility(tabControl, show):
@@ -228,18 +1146,8 @@ def toggleStartColsVisibility(tabControl, show):
     for idx in range(1, len(tabControl.tabs())):
         tabId = tabControl.tabs()[idx]
         tabFrame = tabControl.nametowidget(tabId)
-        if hasattr(tabFrame, "startColsWidgets"):
-            for widgets in tabFrame.startColsWidgets:
-                if show:
-                    widgets["startRowLabel"].pack(side="left", padx=2)
-                    widgets["startRowEntry"].pack(side="left", padx=2)
-                    widgets["columnsLabel"].pack(side="left", padx=2)
-                    widgets["columnsEntry"].pack(side="left", padx=2)
-                else:
-                    widgets["startRowLabel"].pack_forget()
-                    widgets["startRowEntry"].pack_forget()
-                    widgets["columnsLabel"].pack_forget()
-                    widgets["columnsEntry"].pack_forget()
+        if hasattr(tabFrame, "entryTable"):
+            tabFrame.entryTable.showStartCols(show)
 
 
 # === Legacy Excel UI Helpers ===
@@ -259,11 +1167,8 @@ def createTabRows(tabFrame, cheatSheetPath):
     if not os.path.exists(cheatSheetPath):
         return
 
-    try:
-        excelWorkbook = openpyxl.load_workbook(cheatSheetPath, read_only=True)
-        allSheetNames = excelWorkbook.sheetnames
-    except Exception as e:
-        print(f"Error reading Excel file: {e}")
+    allSheetNames = getExcelSheetNames(cheatSheetPath)
+    if not allSheetNames:
         return
 
     with open(cheatSheetPath.replace(".xlsx", ".txt"), "r") as f:
@@ -350,45 +1255,11 @@ def parseCheatSheet(filePath):
             - 'filepath' (str): Filepath
             - 'entries' (List[Dict]): Entries with displayName, sheetName, startRow, columns
     """
-    tabs = []
     try:
-        with open(filePath, "r") as file:
-            lines = [line.strip() for line in file]
-
-        i = 0
-        while i < len(lines):
-            if lines[i].startswith("TabName"):
-                tabName = lines[i].split(",", 1)[1].strip()
-                filePathLine = lines[i + 1].split(",", 1)[1].strip()
-
-                tabEntries = []
-                i += 2
-                while i < len(lines) and lines[i].strip() != "":
-                    parts = [p.strip() for p in lines[i].split(",")]
-                    if len(parts) >= 2:
-                        displayName = parts[0]
-                        sheetName = parts[1]
-                        startRow = parts[2] if len(parts) > 2 else ""
-                        columns = parts[3] if len(parts) > 3 else ""
-                        tabEntries.append({
-                            "displayName": displayName,
-                            "sheetName": sheetName,
-                            "startRow": startRow,
-                            "columns": columns
-                        })
-                    i += 1
-
-                tabs.append({
-                    "name": tabName,
-                    "filepath": filePathLine,
-                    "entries": tabEntries
-                })
-            else:
-                i += 1
+        return loadCheatSheet(filePath).tabs()
     except Exception as e:
         print(f"Error reading cheat sheet: {e}")
-
-    return tabs
+        return []
 
 
 def checkFileStatus(path):
@@ -407,13 +1278,23 @@ def checkFileStatus(path):
 def updateStatusLabel(entryVar, statusLabel):
     """
     Update a status label to indicate if the file path is valid.
+    The check runs on fileStatusService, which keeps the label refreshed.
     
     Args:
         entryVar (tk.StringVar): Entry variable holding file path.
         statusLabel (tk.Label): Label widget to update.
     """
-    path = entryVar.get()
-    exists = checkFileStatus(path)
+    fileStatusService.watch(statusLabel, entryVar)
+
+
+def setStatusLabel(statusLabel, exists):
+    """
+    Show a ✅/❌ file status on a label.
+
+    Args:
+        statusLabel (tk.Label): Label widget to update.
+        exists (bool): Whether the file exists.
+    """
     statusLabel.config(text="✅" if exists else "❌", fg="green" if exists else "red")
 
 
@@ -457,12 +1338,11 @@ def updateCheatsheetStatus(cheatsheetPathVar, cheatsheetStatus):
         cheatsheetPathVar (tk.StringVar): Cheat sheet file path variable.
         cheatsheetStatus (tk.Label): Label widget to update.
     """
-    path = cheatsheetPathVar.get()
-    exists = os.path.isfile(path)
-    cheatsheetStatus.config(text="✅" if exists else "❌", fg="green" if exists else "red")
+    updateStatusLabel(cheatsheetPathVar, cheatsheetStatus)
 
 
-def changeCheatsheetFile(cheatsheetPathVar, cheatsheetStatus, showFullPath, cheatSheetPathContainer, tabDataContainer):
+def changeCheatsheetFile(cheatsheetPathVar, cheatsheetStatus, showFullPath, cheatSheetPathContainer, tabDataContainer,
+                         onCheatSheetChanged=None):
     """
     Open file dialog to select new cheat sheet file and reload tab data.
     
@@ -472,10 +1352,13 @@ def changeCheatsheetFile(cheatsheetPathVar, cheatsheetStatus, showFullPath, chea
         showFullPath (tk.BooleanVar): Whether to show full path.
         cheatSheetPathContainer (List[str]): Mutable container holding cheat sheet path.
         tabDataContainer (List): Mutable container for parsed tab data.
+        onCheatSheetChanged (Callable[[List[Dict]], None], optional): Called with the
+            previous tab data after the switch so existing tabs can be reloaded
+            in place (see reloadChangedTabs).
     
     Side Effects:
         Updates cheat sheet path and tab data containers.
-        Shows info message to restart app for changes.
+        Shows info message about reloading tabs.
     """
     filename = filedialog.askopenfilename(title="Select Cheat Sheet File")
     if filename:
@@ -483,11 +1366,17 @@ def changeCheatsheetFile(cheatsheetPathVar, cheatsheetStatus, showFullPath, chea
         cheatsheetPathVar.set(filename if showFullPath.get() else os.path.basename(filename))
         updateCheatsheetStatus(cheatsheetPathVar, cheatsheetStatus)
 
+        previousTabs = list(tabDataContainer)
         tabDataContainer.clear()
         tabDataContainer.extend(parseCheatSheet(cheatSheetPathContainer[0]))
 
-        messagebox.showinfo("Cheat Sheet Changed",
-                            f"Cheat Sheet file changed to:\n{filename}\n\nRestart app to reload tabs.")
+        if onCheatSheetChanged is not None:
+            onCheatSheetChanged(previousTabs)
+            messagebox.showinfo("Cheat Sheet Changed",
+                                f"Cheat Sheet file changed to:\n{filename}\n\nExisting tabs were reloaded.")
+        else:
+            messagebox.showinfo("Cheat Sheet Changed",
+                                f"Cheat Sheet file changed to:\n{filename}\n\nRestart app to reload tabs.")
 
 
 def toggleCheatsheetRow(cheatsheetFrame, showCheatsheetPath, cheatsheetPathVar, showFullPath, cheatSheetPath, togglesLabel2):
@@ -519,35 +1408,73 @@ def saveInputsToCheatsheet(tabsData, cheatSheetPath):
         cheatSheetPath (str): File path to cheat sheet.
     
     Side Effects:
-        Writes the updated cheat sheet file.
+        Writes the updated cheat sheet file (with any staged tab updates) atomically.
         Shows error messagebox on failure.
     """
     try:
-        with open(cheatSheetPath, "w") as file:
-            for tab in tabsData:
-                file.write(f"TabName,{tab['name']}\n")
-                file.write(f"Filepath,{tab['filepath']}\n")
-                
-                for entry in tab.get("entries", []):
-                    display = entry.get("displayName", "")
-                    sheet = entry.get("sheetName", "")
-                    startRow = entry.get("startRow", "")
-                    columns = entry.get("columns", "")
-                    if startRow or columns:
-                        file.write(f"{display},{sheet},{startRow},{columns}\n")
-                    else:
-                        file.write(f"{display},{sheet}\n")
-                
-                file.write("\n")
+        lines = []
+        for tab in tabsData:
+            lines.append(f"TabName,{tab['name']}")
+            lines.append(f"Filepath,{tab['filepath']}")
+            
+            for entry in tab.get("entries", []):
+                display = entry.get("displayName", "")
+                sheet = entry.get("sheetName", "")
+                startRow = entry.get("startRow", "")
+                columns = entry.get("columns", "")
+                if startRow or columns:
+                    lines.append(f"{display},{sheet},{startRow},{columns}")
+                else:
+                    lines.append(f"{display},{sheet}")
+            
+            lines.append("")
+        cheatSheetWriter.stageText(cheatSheetPath, "".join(line + "\n" for line in lines))
+        if not cheatSheetWriter.flush():
+            return
         print(f"Inputs saved to {cheatSheetPath}")
     except Exception as e:
         messagebox.showerror("Error", f"Failed to save inputs: {e}")
 
 
+def iterCheatSheetSegment(cheatSheetPath, startRow, colRange):
+    """
+    Stream a segment of the cheat sheet file, one row at a time.
+
+    Blank lines are skipped when counting rows. Rows shorter than the column
+    range are padded with "NewColN" placeholders in the yielded values only;
+    the file is never written. Lines are read lazily, so stopping early reads
+    no further than the last row taken.
+
+    Args:
+        cheatSheetPath (str): Path to cheat sheet text file.
+        startRow (int): Zero-based row (among non-blank lines) to start reading.
+        colRange (str): Excel column range string (e.g., 'A:D', 'Z:AC').
+
+    Yields:
+        List[str]: Selected columns of one line.
+
+    Raises:
+        ValueError: If the column range is invalid.
+    """
+    colIndices = colRangeToIndices(colRange)
+    width = max(colIndices) + 1
+
+    with open(cheatSheetPath, "r") as f:
+        lines = (line.strip() for line in f)
+        for line in itertools.islice((line for line in lines if line), startRow, None):
+            parts = [p.strip() for p in line.split(",")]
+
+            # Pad short rows in the returned view only
+            if len(parts) < width:
+                parts += [f"NewCol{j+1}" for j in range(width - len(parts))]
+
+            yield [parts[idx] for idx in colIndices]
+
+
 def loadCheatSheetSegment(cheatSheetPath, startRow, colRange):
     """
     Load a segment of data from cheat sheet file starting at a specific row
-    and restricted to specified columns. Appends new columns if needed.
+    and restricted to specified columns (see iterCheatSheetSegment).
     
     Args:
         cheatSheetPath (str): Path to cheat sheet text file.
@@ -557,38 +1484,7 @@ def loadCheatSheetSegment(cheatSheetPath, startRow, colRange):
     Returns:
         List[List[str]]: List of lists representing the selected columns per line.
     """
-    def _colRangeToIndices(rangeStr):
-        letters = list(string.ascii_uppercase)
-        start, end = rangeStr.split(":")
-        startIdx = letters.index(start.upper())
-        endIdx = letters.index(end.upper())
-        return list(range(startIdx, endIdx + 1))
-
-    colIndices = _colRangeToIndices(colRange)
-
-    with open(cheatSheetPath, "r") as f:
-        lines = [line.strip() for line in f if line.strip()]
-
-    data = []
-    modified = False
-    for i, line in enumerate(lines[startRow:], start=startRow):
-        parts = [p.strip() for p in line.split(",")]
-
-        # Append new columns if needed
-        if len(parts) <= max(colIndices):
-            needed = max(colIndices) + 1 - len(parts)
-            parts += [f"NewCol{j+1}" for j in range(needed)]
-            lines[i] = ",".join(parts)
-            modified = True
-
-        selected = [parts[idx] for idx in colIndices]
-        data.append(selected)
-
-    if modified:
-        with open(cheatSheetPath, "w") as f:
-            f.write("\n".join(lines) + "\n")
-
-    return data
+    return list(iterCheatSheetSegment(cheatSheetPath, startRow, colRange))
 #Mexico
 def buildWorkspaceSnapshot(tabControl):
     workspace = {}
@@ -603,15 +1499,9 @@ def buildWorkspaceSnapshot(tabControl):
         if hasattr(tabFrame, "useForAdjVar"):
             tabData["use_for_adjudication"] = tabFrame.useForAdjVar.get()
 
-        if hasattr(tabFrame, "entries"):
-            tabData["entries"] = []
-            for entry in tabFrame.entries:
-                tabData["entries"].append({
-                    "displayName": entry["displayName"],
-                    "sheet": entry["selectedSheetVar"].get(),
-                    "startRow": entry["startRowVar"].get(),
-                    "columns": entry["columnsVar"].get()
-                })
+        entries = getTabEntryValues(tabFrame)
+        if entries is not None:
+            tabData["entries"] = entries
 
         workspace[tabName] = tabData
 
@@ -625,8 +1515,10 @@ def incrementAllMoveNumbers(cheatSheetPath):
         cheatSheetPath (str): Path to the cheat sheet file.
 
     Side Effects:
-        Updates the cheat sheet file in place.
+        Updates the cheat sheet file atomically (flushing any staged tab updates first).
     """
+    cheatSheetWriter.flush()
+
     # Read original content
     with open(cheatSheetPath, "r") as f:
         content = f.read()
@@ -639,13 +1531,9 @@ def incrementAllMoveNumbers(cheatSheetPath):
     # Replace all occurrences of Move N with Move N+1
     new_content = re.sub(r"Move (\d+)", increment_match, content)
 
-    # Write updated content safely
-    dir_name = os.path.dirname(cheatSheetPath)
-    with tempfile.NamedTemporaryFile("w", dir=dir_name, delete=False) as tmp_file:
-        tmp_file.write(new_content)
-        temp_name = tmp_file.name
-
-    os.replace(temp_name, cheatSheetPath)
+    # Write updated content safely (journaled, atomic replace)
+    cheatSheetWriter.stageText(cheatSheetPath, new_content)
+    cheatSheetWriter.flush()
 
 
 def buildFilenamesDictFromTabs(tabControl):
@@ -669,27 +1557,1126 @@ def buildFilenamesDictFromTabs(tabControl):
         tabFrame = tabControl.nametowidget(tabId)
         tabName = tabControl.tab(tabId, "text")
         #mexico
-        if hasattr(tabFrame, "useForAdjVar") and not tabFrame.useForAdjVar.get():
+        if not hasattr(tabFrame, "useForAdjVar") or not tabFrame.useForAdjVar.get():
             continue
         #end mexico
         filenames[tabName] = {}
 
-        # tabFrame.entries is list of dicts with sheetVar, startRowVar, columnsVar
-        if hasattr(tabFrame, "entries"):
-            for entry in tabFrame.entries:
-                sheetName = entry["selectedSheetVar"].get()
-                startRowStr = entry["startRowVar"].get()
-                columnsStr = entry["columnsVar"].get()
+        # Widget values for built tabs, parsed cheat sheet values for unbuilt ones
+        entries = getTabEntryValues(tabFrame)
+        if entries is not None:
+            filenames[tabName] = entrySelections(entries)
 
-                # Parse start row (default to 0)
-                startRow = int(startRowStr) - 1 if startRowStr.strip().isdigit() else 0
+    return filenames
+
+
+def entrySelections(entries):
+    """
+    Convert a tab's entry values into sheet selections.
+
+    Args:
+        entries (List[Dict]): getTabEntryValues-style dicts.
+
+    Returns:
+        Dict[str, Tuple[int, List[int]]]: Sheet name -> (zero-based startRow, colIndices).
+    """
+    selections = {}
+    for entry in entries:
+        sheetName = entry["sheet"]
+        startRowStr = entry["startRow"]
+        columnsStr = entry["columns"]
+
+        # Parse start row (default to 0)
+        startRow = int(startRowStr) - 1 if startRowStr.strip().isdigit() else 0
+
+        # Parse columns string to indices
+        try:
+            colIndices = colRangeToIndices(columnsStr) if columnsStr else list(range(26))
+        except Exception:
+            colIndices = list(range(26))
+
+        selections[sheetName] = (startRow, colIndices)
+    return selections
 
-                # Parse columns string to indices
-                try:
-                    colIndices = colRangeToIndices(columnsStr) if columnsStr else list(range(26))
-                except Exception:
-                    colIndices = list(range(26))
 
-                filenames[tabName][sheetName] = (startRow, colIndices)
+def buildFilenamesDictFromTabData(tabData, adjudicationFlags=None):
+    """
+    Build the buildFilenamesDictFromTabs structure straight from parsed cheat
+    sheet data, without any widgets.
+
+    Args:
+        tabData (List[Dict]): parseCheatSheet output.
+        adjudicationFlags (List[int], optional): 1/0 per tab (in tabData order,
+            skipping any 'Home' tab); defaults to every tab enabled.
+
+    Returns:
+        Dict[str, Dict[str, Tuple[int, List[int]]]]: Tab -> sheet -> (startRow, colIndices)
+        for the tabs used for adjudication.
+    """
+    tabs = [tab for tab in tabData if tab["name"].lower() != "home"]
+    if adjudicationFlags is None:
+        adjudicationFlags = [1] * len(tabs)
 
+    filenames = {}
+    for tab, flag in zip(tabs, adjudicationFlags):
+        if flag:
+            filenames[tab["name"]] = entrySelections(tabDataEntryValues(tab))
     return filenames
+
+
+# === Resource Table Cache ===
+
+TABLE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".maage", "tablecache")
+TABLE_CACHE_VERSION = 2
+
+_SHARED_STRING_REF = re.compile(rb'<(?:\w+:)?c\b[^>]*\bt="s"[^>]*>\s*<(?:\w+:)?v>(\d+)<')
+_sheetHashCache = {}  # (abspath, sheetName) -> ((abspath, mtime_ns, size), sha256)
+
+
+def _readSharedStrings(archive):
+    """Return the shared string table of an open .xlsx archive."""
+    if "xl/sharedStrings.xml" not in archive.namelist():
+        return []
+    strings = []
+    textTag = f"{{{_XLSX_NS['main']}}}t"
+    phoneticTag = f"{{{_XLSX_NS['main']}}}rPh"
+    with archive.open("xl/sharedStrings.xml") as stream:
+        for _, element in ElementTree.iterparse(stream):
+            if element.tag == f"{{{_XLSX_NS['main']}}}si":
+                phonetic = {id(t) for rPh in element.iter(phoneticTag) for t in rPh.iter(textTag)}
+                strings.append("".join(t.text or "" for t in element.iter(textTag) if id(t) not in phonetic))
+                element.clear()
+    return strings
+
+
+def sheetContentHash(filePath, sheetName):
+    """
+    Hash the content of one sheet: its worksheet XML part plus the shared
+    strings it references, so edits to other sheets leave the hash unchanged.
+
+    Hashes are memoised per (path, mtime, size).
+
+    Args:
+        filePath (str): Path to the .xlsx file.
+        sheetName (str): Sheet to hash.
+
+    Returns:
+        str: Hex SHA-256 digest.
+
+    Raises:
+        zipfile.BadZipFile: If the file is not an .xlsx workbook.
+        KeyError: If the sheet does not exist.
+    """
+    fileKey = _workbookKey(filePath)
+    memo = _sheetHashCache.get((fileKey[0], sheetName))
+    if memo is not None and memo[0] == fileKey:
+        return memo[1]
+
+    with zipfile.ZipFile(filePath) as archive:
+        part = _sheetPartPaths(archive).get(sheetName)
+        if not part:
+            raise KeyError(f"Worksheet named '{sheetName}' not found")
+        sheetXml = archive.read(part)
+        digest = hashlib.sha256(sheetXml)
+        refs = _SHARED_STRING_REF.findall(sheetXml)
+        if refs:
+            strings = _readSharedStrings(archive)
+            for ref in refs:
+                idx = int(ref)
+                digest.update(b"\0" + (strings[idx] if idx < len(strings) else "").encode("utf-8"))
+
+    contentHash = digest.hexdigest()
+    _sheetHashCache[(fileKey[0], sheetName)] = (fileKey, contentHash)
+    return contentHash
+
+
+def _tableCacheStem(contentHash, startRow, colIndices):
+    keyText = f"{TABLE_CACHE_VERSION}|{contentHash}|{startRow}|{','.join(map(str, colIndices))}"
+    return os.path.join(TABLE_CACHE_DIR, hashlib.sha256(keyText.encode("utf-8")).hexdigest())
+
+
+def _splitMixedColumn(values):
+    """
+    Split an object column (e.g. a text heading above numbers) into float,
+    int, text and datetime lists holding each cell in exactly one of them.
+
+    Raises:
+        TypeError: If a cell is some other type (booleans, times, ...).
+    """
+    floats, ints, texts, stamps = ([None] * len(values) for _ in range(4))
+    for i, value in enumerate(values):
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            continue
+        if isinstance(value, str):
+            texts[i] = value
+        elif type(value) is datetime.datetime:
+            stamps[i] = value
+        elif isinstance(value, bool):
+            raise TypeError("boolean cells in a mixed column")
+        elif isinstance(value, int):
+            ints[i] = value
+        elif isinstance(value, float):
+            floats[i] = value
+        else:
+            raise TypeError(f"{type(value).__name__} cells in a mixed column")
+    return floats, ints, texts, stamps
+
+
+def _readCachedTable(stem):
+    """Return a cached table (memory-mapping its Arrow file), or None on a miss."""
+    pa = _importArrow() if os.path.isfile(stem + ".arrow") else None
+    if pa is None:
+        return None
+    try:
+        import numpy as np
+        import pandas as pd
+
+        with pa.memory_map(stem + ".arrow", "r") as source:
+            arrowTable = pa.ipc.open_file(source).read_all()
+        names = set(arrowTable.column_names)
+        columns = {}
+        for name in arrowTable.column_names:
+            if "#" in name:
+                continue
+            column = arrowTable.column(name).combine_chunks()
+            if name + "#s" not in names:
+                columns[int(name)] = column.to_pandas()
+                continue
+            # Mixed column: reassemble the float, int and text parts in one object column
+            values = np.full(len(column), np.nan, dtype=object)
+            for part, fill in ((column, 0.0), (arrowTable.column(name + "#i").combine_chunks(), 0)):
+                valid = part.is_valid().to_numpy(zero_copy_only=False)
+                values[valid] = part.fill_null(fill).to_numpy(zero_copy_only=False)[valid].tolist()
+            for part in ("#s", "#t"):
+                for i, value in enumerate(arrowTable.column(name + part).to_pylist()):
+                    if value is not None:
+                        values[i] = value
+            columns[int(name)] = pd.Series(values, dtype=object)
+        return pd.DataFrame(columns, index=pd.RangeIndex(arrowTable.num_rows))
+    except Exception as e:
+        print(f"Ignoring unreadable table cache {stem}.arrow: {e}")
+    return None
+
+
+def _writeCachedTable(stem, table):
+    """
+    Save a table as an Arrow IPC file.
+
+    Object columns are stored as float, int, text and datetime columns
+    ("3", "3#i", "3#s", "3#t") so header rows and notes above numbers stay
+    columnar. Tables Arrow cannot hold exactly (e.g. booleans mixed with
+    text) are not cached and will be parsed from the workbook again.
+    """
+    pa = _importArrow()
+    if pa is None:
+        return
+    try:
+        arrays, names = [], []
+        for col in table.columns:
+            series = table[col]
+            if series.dtype == object:
+                floats, ints, texts, stamps = _splitMixedColumn(series.tolist())
+                arrays += [pa.array(floats, pa.float64()), pa.array(ints, pa.int64()),
+                           pa.array(texts, pa.string()), pa.array(stamps, pa.timestamp("us"))]
+                names += [str(col), f"{col}#i", f"{col}#s", f"{col}#t"]
+            else:
+                arrays.append(pa.Array.from_pandas(series))
+                names.append(str(col))
+        arrowTable = pa.Table.from_arrays(arrays, names=names)
+    except (TypeError, ValueError, OverflowError, pa.ArrowException):
+        return  # Not representable; this selection is re-parsed each time
+
+    try:
+        os.makedirs(TABLE_CACHE_DIR, exist_ok=True)
+        with tempfile.NamedTemporaryFile("wb", dir=TABLE_CACHE_DIR, delete=False) as tmpFile:
+            tempName = tmpFile.name
+        with pa.OSFile(tempName, "wb") as sink, pa.ipc.new_file(sink, arrowTable.schema) as writer:
+            writer.write_table(arrowTable)
+        os.replace(tempName, stem + ".arrow")
+    except OSError as e:
+        print(f"Could not write table cache: {e}")
+
+
+def clearTableCache():
+    """Delete every cached resource table."""
+    if os.path.isdir(TABLE_CACHE_DIR):
+        for name in os.listdir(TABLE_CACHE_DIR):
+            try:
+                os.remove(os.path.join(TABLE_CACHE_DIR, name))
+            except OSError:
+                pass
+    _sheetHashCache.clear()
+
+
+def readSheetTable(filePath, sheetName, startRow=0, colIndices=None, useCache=True):
+    """
+    Read one sheet selection, reusing the columnar cache when the sheet is unchanged.
+
+    The cache key is the sheet's content hash plus the selection, so a table
+    is only parsed from Excel again after that sheet (or its strings) changes.
+
+    Args:
+        filePath (str): Workbook path.
+        sheetName (str): Sheet to read.
+        startRow (int): Zero-based first row to read.
+        colIndices (List[int], optional): Zero-based columns to keep; defaults to A:Z.
+        useCache (bool): Read and write the table cache.
+
+    Returns:
+        DataFrame: Selected rows/columns, labelled by zero-based column index.
+    """
+    colIndices = list(range(26)) if colIndices is None else list(colIndices)
+    stem = None
+    if useCache:
+        try:
+            stem = _tableCacheStem(sheetContentHash(filePath, sheetName), startRow, colIndices)
+            cached = _readCachedTable(stem)
+            if cached is not None:
+                return cached
+        except (zipfile.BadZipFile, KeyError):
+            stem = None
+
+    wanted = set(colIndices)
+    table = getWorkbook(filePath).parse(sheetName, header=None, skiprows=startRow,
+                                        usecols=lambda col: col in wanted)
+    if stem is not None:
+        _writeCachedTable(stem, table)
+    return table
+
+
+# === Resource Table Loading ===
+
+def buildTabPathsFromTabData(tabData):
+    """
+    Map tab names to workbook paths from parsed cheat sheet data.
+
+    Args:
+        tabData (List[Dict]): Output of parseCheatSheet.
+
+    Returns:
+        Dict[str, str]: Tab name -> workbook filepath.
+    """
+    return {tab["name"]: tab["filepath"] for tab in tabData}
+
+
+def _readWorkbookTables(filePath, selections, asNumpy=False):
+    """
+    Read selected sheets of one workbook (runs in a worker process).
+
+    Args:
+        filePath (str): Workbook path.
+        selections (List[Tuple[str, int, List[int]]]): (sheetName, startRow, colIndices).
+        asNumpy (bool): Return NumPy arrays instead of DataFrames.
+
+    Returns:
+        Dict[Tuple[str, int, Tuple[int, ...]], DataFrame | np.ndarray]: Tables keyed by selection.
+    """
+    tables = {}
+    for sheetName, startRow, colIndices in selections:
+        try:
+            table = readSheetTable(filePath, sheetName, startRow, colIndices)
+        except Exception as e:
+            print(f"Error reading sheet '{sheetName}' from {filePath}: {e}")
+            continue
+        tables[(sheetName, startRow, tuple(colIndices))] = table.to_numpy() if asNumpy else table
+    return tables
+
+
+def loadResourceTables(filenames, tabPaths, maxWorkers=None, asNumpy=False):
+    """
+    Load only the sheets, rows and columns described by buildFilenamesDictFromTabs.
+
+    Each selection is taken from the resource table cache if its sheet is
+    unchanged (see readSheetTable); otherwise the sheet is parsed and only
+    its start row onwards and listed columns are kept. openpyxl still reads
+    every cell of a parsed sheet, so the saving comes from the cache, not
+    from the selection. Selections are grouped by workbook so every file
+    is opened at most once, and different workbooks are read concurrently
+    in a ProcessPoolExecutor. On Windows, call this from under an
+    ``if __name__ == "__main__":`` guard.
+
+    Args:
+        filenames (Dict[str, Dict[str, Tuple[int, List[int]]]]): Output of
+            buildFilenamesDictFromTabs; non-dict entries such as
+            '_postprocess' are ignored.
+        tabPaths (Dict[str, str]): Tab name -> workbook path
+            (see buildTabPathsFromTabData).
+        maxWorkers (int, optional): Pool size; 1 reads serially in-process.
+        asNumpy (bool): Return NumPy arrays instead of DataFrames.
+
+    Returns:
+        Dict[str, Dict[str, DataFrame | np.ndarray]]: Tab -> sheet -> table.
+        Columns are labelled by zero-based Excel column index; tables that
+        fail to load are reported and left out.
+    """
+    selectionsByPath = collections.defaultdict(list)
+    for tabName, sheets in filenames.items():
+        if not isinstance(sheets, dict):
+            continue
+        filePath = tabPaths.get(tabName)
+        if not filePath:
+            print(f"No workbook path for tab '{tabName}'")
+            continue
+        for sheetName, (startRow, colIndices) in sheets.items():
+            selection = (sheetName, startRow, list(colIndices))
+            if selection not in selectionsByPath[filePath]:
+                selectionsByPath[filePath].append(selection)
+
+    if maxWorkers == 1 or len(selectionsByPath) <= 1:
+        loaded = {path: _readWorkbookTables(path, sel, asNumpy) for path, sel in selectionsByPath.items()}
+    else:
+        with ProcessPoolExecutor(max_workers=maxWorkers) as pool:
+            futures = {path: pool.submit(_readWorkbookTables, path, sel, asNumpy)
+                       for path, sel in selectionsByPath.items()}
+            loaded = {}
+            for path, future in futures.items():
+                try:
+                    loaded[path] = future.result()
+                except Exception as e:
+                    print(f"Error reading Excel file {path}: {e}")
+                    loaded[path] = {}
+
+    tables = {}
+    for tabName, sheets in filenames.items():
+        if not isinstance(sheets, dict) or tabName not in tabPaths:
+            continue
+        tables[tabName] = {}
+        for sheetName, (startRow, colIndices) in sheets.items():
+            table = loaded.get(tabPaths[tabName], {}).get((sheetName, startRow, tuple(colIndices)))
+            if table is not None:
+                tables[tabName][sheetName] = table
+    return tables
+
+
+# === File Watcher ===
+
+_UNSEEN = object()
+
+
+def _pathKey(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _statSignature(path):
+    """Return (mtime_ns, size) for a file, or None if it cannot be reached."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class FileWatcher:
+    """
+    Poll files with os.stat on a background thread and report changes on the Tk thread.
+
+    A change is reported once a file's (mtime, size) has been stable for one
+    polling interval, so half-written saves are not picked up. Callbacks run
+    through root.after, never on the polling thread.
+    """
+
+    def __init__(self, root, onChange, interval=2.0):
+        """
+        Args:
+            root (tk.Tk): Root window used to schedule callbacks.
+            onChange (Callable[[List[str]], None]): Called with the changed paths.
+            interval (float): Seconds between polls.
+        """
+        self.root = root
+        self.onChange = onChange
+        self.interval = interval
+        self._signatures = {}  # path -> last reported signature
+        self._pending = {}     # path -> signature seen once, waiting to settle
+        self._lock = threading.Lock()
+        self._changes = queue.Queue()
+        self._stopEvent = threading.Event()
+        self._thread = None
+
+    def setPaths(self, paths):
+        """
+        Replace the set of watched paths, keeping known state for retained ones.
+
+        Args:
+            paths (Iterable[str]): Files to watch.
+        """
+        with self._lock:
+            self._signatures = {p: self._signatures.get(p, _UNSEEN) for p in dict.fromkeys(paths) if p}
+            self._pending = {p: s for p, s in self._pending.items() if p in self._signatures}
+
+    def start(self):
+        """Start polling in a daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="FileWatcher", daemon=True)
+            self._thread.start()
+            self.root.after(250, self._drain)
+
+    def stop(self):
+        """Stop polling; pending callbacks are dropped."""
+        self._stopEvent.set()
+
+    def acknowledge(self, path):
+        """
+        Treat a watched file's current state as already seen (e.g. after the app wrote it).
+
+        Args:
+            path (str): File that was just written.
+        """
+        signature = _statSignature(path)
+        with self._lock:
+            for watched in self._signatures:
+                if _pathKey(watched) == _pathKey(path):
+                    self._signatures[watched] = signature
+                    self._pending.pop(watched, None)
+
+    def poll(self):
+        """Stat every watched path once and queue settled changes."""
+        with self._lock:
+            snapshot = list(self._signatures.items())
+        for path, known in snapshot:
+            signature = _statSignature(path)
+            with self._lock:
+                if path not in self._signatures:
+                    continue
+                if known is _UNSEEN:
+                    self._signatures[path] = signature
+                elif signature == known:
+                    self._pending.pop(path, None)
+                elif self._pending.get(path, _UNSEEN) == signature:
+                    self._signatures[path] = signature
+                    del self._pending[path]
+                    self._changes.put(path)
+                else:
+                    self._pending[path] = signature
+
+    def _run(self):
+        while not self._stopEvent.wait(self.interval):
+            self.poll()
+
+    def _drain(self):
+        if self._stopEvent.is_set():
+            return
+        changed = []
+        while not self._changes.empty():
+            changed.append(self._changes.get_nowait())
+        if changed:
+            try:
+                self.onChange(sorted(set(changed)))
+            except Exception as e:
+                print(f"Error reloading changed files: {e}")
+        self.root.after(250, self._drain)
+
+
+def invalidateSheetHashes(filePath):
+    """
+    Forget memoised sheet content hashes for a workbook.
+
+    Args:
+        filePath (str): Workbook path.
+    """
+    fileKey = os.path.abspath(filePath)
+    for key in [k for k in _sheetHashCache if k[0] == fileKey]:
+        del _sheetHashCache[key]
+
+
+def diffCheatSheetTabs(oldTabs, newTabs):
+    """
+    Compare two parsed cheat sheets section by section.
+
+    Args:
+        oldTabs (List[Dict]): Previous parseCheatSheet output.
+        newTabs (List[Dict]): Current parseCheatSheet output.
+
+    Returns:
+        Tuple[Set[str], List[str], List[str]]: Names of changed, added and
+        removed tabs (tab names compare case-insensitively).
+    """
+    oldByName = {tab["name"].lower(): tab for tab in oldTabs}
+    newByName = {tab["name"].lower(): tab for tab in newTabs}
+    changed = {tab["name"] for key, tab in newByName.items()
+               if key in oldByName and (oldByName[key]["filepath"], oldByName[key]["entries"])
+               != (tab["filepath"], tab["entries"])}
+    added = [tab["name"] for key, tab in newByName.items() if key not in oldByName]
+    removed = [tab["name"] for key, tab in oldByName.items() if key not in newByName]
+    return changed, added, removed
+
+
+def reloadChangedTabs(tabControl, changedPaths, cheatSheetPath, tabData, showStartCols=False, previousTabs=None,
+                      loader=None):
+    """
+    Rebuild only the tabs affected by changed files.
+
+    A changed cheat sheet is re-parsed and diffed per section; a changed
+    workbook is dropped from the workbook cache and its sheet hashes are
+    forgotten, so only its edited sheets miss the table cache. Tabs whose
+    section or workbook changed are rebuilt with rebuildTab; after a switch
+    to another cheat sheet (previousTabs given) every built tab is rebuilt,
+    so its Update button writes to the new file.
+
+    Args:
+        tabControl (ttk.Notebook): Main tab control widget.
+        changedPaths (Iterable[str]): Paths reported by FileWatcher.
+        cheatSheetPath (str): Current cheat sheet path.
+        tabData (List[Dict]): Parsed cheat sheet, updated in place.
+        showStartCols (bool): Whether Start Row/Columns inputs are shown.
+        previousTabs (List[Dict], optional): Tab data before tabData was already
+            replaced (e.g. after switching cheat sheet files).
+        loader (BackgroundLoader, optional): Loader for the rebuilds' disk reads.
+
+    Returns:
+        Tuple[List[str], List[str], List[str]]: Rebuilt (or, with a loader,
+        scheduled), added and removed tab names.
+    """
+    changedKeys = {_pathKey(p) for p in changedPaths}
+    rebuild, added, removed = set(), [], []
+
+    if previousTabs is not None or _pathKey(cheatSheetPath) in changedKeys:
+        oldTabs = list(tabData) if previousTabs is None else previousTabs
+        if previousTabs is None:
+            tabData[:] = parseCheatSheet(cheatSheetPath)
+        changed, added, removed = diffCheatSheetTabs(oldTabs, tabData)
+        if previousTabs is not None:
+            changed = {tab["name"] for tab in tabData}
+        rebuild |= {name.lower() for name in changed}
+
+    for path in changedPaths:
+        if _pathKey(path) != _pathKey(cheatSheetPath):
+            invalidateWorkbook(path)
+            invalidateSheetHashes(path)
+    tabsByName = {tab["name"].lower(): tab for tab in tabData}
+    rebuild |= {key for key, tab in tabsByName.items() if _pathKey(tab["filepath"]) in changedKeys}
+
+    rebuilt = []
+    for tabId in tabControl.tabs()[1:]:
+        tabFrame = tabControl.nametowidget(tabId)
+        tabName = tabControl.tab(tabId, "text")
+        tab = tabsByName.get(tabName.lower())
+        if tab is None:
+            continue
+        if getattr(tabFrame, "pendingTab", None) is not None:
+            tabFrame.pendingTab = tab  # Not built yet; it will be built from the new data
+            tabFrame.pendingCheatSheetPath = cheatSheetPath
+            continue
+        if tabName.lower() not in rebuild or not hasattr(tabFrame, "entries"):
+            continue
+        rebuildTab(tabFrame, tab["filepath"], cheatSheetPath, tabName, showStartCols, loader)
+        rebuilt.append(tabName)
+    return rebuilt, added, removed
+
+
+# === Background Loading ===
+
+class BackgroundLoader:
+    """
+    Run blocking file and workbook reads on worker threads and deliver the
+    results on the Tk thread.
+
+    Jobs run in a ThreadPoolExecutor. A root.after poll drains finished jobs,
+    calls their callbacks on the Tk thread and reports progress, so the
+    mainloop never blocks on I/O. cancel() drops every outstanding job:
+    queued jobs never start and results of running ones are discarded.
+    """
+
+    def __init__(self, root, maxWorkers=4, pollMs=50, onProgress=None):
+        """
+        Args:
+            root (tk.Tk): Root window used to schedule polling.
+            maxWorkers (int): Worker threads.
+            pollMs (int): Milliseconds between result polls while jobs are outstanding.
+            onProgress (Callable[[int, int], None], optional): Called with
+                (completed, total) whenever progress changes; (0, 0) when idle.
+        """
+        self.root = root
+        self.pollMs = pollMs
+        self.onProgress = onProgress
+        self._executor = ThreadPoolExecutor(max_workers=maxWorkers, thread_name_prefix="MAAGELoader")
+        self._finished = queue.Queue()
+        self._outstanding = {}  # future -> (onDone, onError, onCancel)
+        self._completed = 0
+        self._total = 0
+        self._polling = False
+
+    @property
+    def busy(self):
+        """bool: True while jobs are outstanding."""
+        return bool(self._outstanding)
+
+    def submit(self, func, *args, onDone=None, onError=None, onCancel=None):
+        """
+        Run func(*args) in the background.
+
+        Args:
+            func (Callable): Blocking function; must not touch Tk widgets.
+            onDone (Callable[[Any], None], optional): Called with the result on the Tk thread.
+            onError (Callable[[Exception], None], optional): Called with the exception
+                on the Tk thread; errors are printed if omitted.
+            onCancel (Callable[[], None], optional): Called if the job is cancelled.
+
+        Returns:
+            concurrent.futures.Future: The job's future.
+        """
+        future = self._executor.submit(func, *args)
+        self._outstanding[future] = (onDone, onError, onCancel)
+        self._total += 1
+        future.add_done_callback(self._finished.put)
+        self._reportProgress()
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.pollMs, self._poll)
+        return future
+
+    def cancel(self):
+        """Cancel every outstanding job and reset progress."""
+        outstanding = list(self._outstanding.items())
+        self._outstanding.clear()
+        self._completed = self._total = 0
+        self._reportProgress()
+        for future, (_, _, onCancel) in outstanding:
+            future.cancel()
+            if onCancel is not None:
+                onCancel()
+
+    def shutdown(self):
+        """Cancel outstanding jobs and stop the worker threads."""
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _poll(self):
+        while True:
+            try:
+                future = self._finished.get_nowait()
+            except queue.Empty:
+                break
+            job = self._outstanding.pop(future, None)
+            if job is None or future.cancelled():
+                continue  # Cancelled; result is discarded
+            onDone, onError, _ = job
+            self._completed += 1
+            try:
+                error = future.exception()
+                if error is not None:
+                    if onError is not None:
+                        onError(error)
+                    else:
+                        print(f"Background load failed: {error}")
+                elif onDone is not None:
+                    onDone(future.result())
+            except Exception as e:
+                print(f"Error handling background load result: {e}")
+
+        if self._outstanding:
+            self._reportProgress()
+            self.root.after(self.pollMs, self._poll)
+        else:
+            self._polling = False
+            self._completed = self._total = 0
+            self._reportProgress()
+
+    def _reportProgress(self):
+        if self.onProgress is not None:
+            self.onProgress(self._completed, self._total)
+
+
+def updateLoadProgress(progressBar, progressLabel, completed, total):
+    """
+    Show BackgroundLoader progress on the Home tab.
+
+    Args:
+        progressBar (ttk.Progressbar): Determinate progress bar.
+        progressLabel (tk.Label): Status text label.
+        completed (int): Jobs finished.
+        total (int): Jobs submitted (0 when idle).
+    """
+    if total:
+        progressBar.config(maximum=total, value=completed)
+        progressLabel.config(text=f"Loading... {completed}/{total}")
+    else:
+        progressBar.config(value=0)
+        progressLabel.config(text="Ready")
+
+
+# === File Status Service ===
+
+FILE_STATUS_TTL = 10.0  # Seconds a file existence check stays fresh
+FILE_STATUS_REFRESH_MS = 15000  # Background re-check interval for watched labels
+
+
+class FileStatusService:
+    """
+    Cached, asynchronous ✅/❌ file status for path labels.
+
+    Labels are registered with the variable (or callable) holding their path.
+    Paths are checked with os.path.isfile on a thread pool, and each path has
+    at most one check in flight. Results are cached for FILE_STATUS_TTL
+    seconds and applied to every label showing that path via root.after, so a
+    slow or unreachable share never blocks the Tk thread. Watched labels are
+    re-checked every FILE_STATUS_REFRESH_MS once started. Until a root is
+    attached, checks run synchronously.
+    """
+
+    def __init__(self, root=None, ttl=FILE_STATUS_TTL, refreshMs=FILE_STATUS_REFRESH_MS, maxWorkers=8, pollMs=100):
+        """
+        Args:
+            root (tk.Tk, optional): Root window used to schedule result polling.
+            ttl (float): Seconds a cached result is reused.
+            refreshMs (int): Milliseconds between background refreshes.
+            maxWorkers (int): Threads checking paths concurrently.
+            pollMs (int): Milliseconds between result polls while checks are running.
+        """
+        self.root = root
+        self.ttl = ttl
+        self.refreshMs = refreshMs
+        self.pollMs = pollMs
+        self.maxWorkers = maxWorkers
+        self._executor = None
+        self._results = queue.Queue()
+        self._cache = {}  # path -> (exists, time.monotonic() of the check)
+        self._inFlight = set()
+        self._labels = {}  # statusLabel -> path variable or callable
+        self._polling = False
+        self._refreshId = None
+
+    def attach(self, root):
+        """Check paths in the background and report on root's event loop from now on."""
+        self.root = root
+
+    def start(self):
+        """Start periodic background refreshes of watched labels."""
+        if self._refreshId is None and self.root is not None:
+            self._refreshId = self.root.after(self.refreshMs, self._periodicRefresh)
+
+    def stop(self):
+        """Stop refreshing and release the worker threads."""
+        if self._refreshId is not None:
+            try:
+                self.root.after_cancel(self._refreshId)
+            except tk.TclError:
+                pass
+            self._refreshId = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def watch(self, statusLabel, pathSource):
+        """
+        Show a path's status on a label and keep it refreshed.
+
+        Args:
+            statusLabel (tk.Label): Label to update.
+            pathSource (tk.StringVar | Callable[[], str]): Holds the path to check.
+        """
+        self._labels[statusLabel] = pathSource
+        self._update(statusLabel)
+
+    def unwatch(self, statusLabel):
+        """Stop updating a label."""
+        self._labels.pop(statusLabel, None)
+
+    def refresh(self, force=False):
+        """
+        Re-check the paths of all watched labels.
+
+        Args:
+            force (bool): Ignore cached results.
+        """
+        if force:
+            # Mark every result stale; labels keep showing it until the re-check lands
+            self._cache = {path: (exists, float("-inf")) for path, (exists, _) in self._cache.items()}
+        for statusLabel in list(self._labels):
+            self._update(statusLabel)
+
+    def status(self, path):
+        """
+        Args:
+            path (str): File path.
+
+        Returns:
+            bool | None: Cached existence, or None if unknown or stale.
+        """
+        entry = self._cache.get(path)
+        if entry is None or time.monotonic() - entry[1] > self.ttl:
+            return None
+        return entry[0]
+
+    def _pathOf(self, statusLabel):
+        source = self._labels[statusLabel]
+        return source() if callable(source) else source.get()
+
+    def _update(self, statusLabel):
+        path = self._pathOf(statusLabel)
+        exists = self.status(path)
+        if exists is None and self.root is None:
+            exists = checkFileStatus(path)
+            self._cache[path] = (exists, time.monotonic())
+        if exists is not None:
+            self._setLabel(statusLabel, exists)
+            return
+        if path not in self._cache:
+            self._setLabel(statusLabel, None)  # Never checked; a stale result stays shown meanwhile
+        self._submit(path)
+
+    def _submit(self, path):
+        if path in self._inFlight:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.maxWorkers, thread_name_prefix="MAAGEFileStatus")
+        self._inFlight.add(path)
+        self._executor.submit(self._check, path)
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.pollMs, self._drain)
+
+    def _check(self, path):
+        try:
+            exists = checkFileStatus(path)
+        except OSError:
+            exists = False
+        self._results.put((path, exists, time.monotonic()))
+
+    def _drain(self):
+        while True:
+            try:
+                path, exists, checkedAt = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._inFlight.discard(path)
+            self._cache[path] = (exists, checkedAt)
+            for statusLabel in list(self._labels):
+                if self._pathOf(statusLabel) == path:
+                    self._setLabel(statusLabel, exists)
+        if self._inFlight:
+            self.root.after(self.pollMs, self._drain)
+        else:
+            self._polling = False
+
+    def _periodicRefresh(self):
+        self.refresh()
+        self._refreshId = self.root.after(self.refreshMs, self._periodicRefresh)
+
+    def _setLabel(self, statusLabel, exists):
+        try:
+            if exists is None:
+                statusLabel.config(text="…", fg="grey")
+            else:
+                setStatusLabel(statusLabel, exists)
+        except tk.TclError:  # Label was destroyed
+            self.unwatch(statusLabel)
+
+
+fileStatusService = FileStatusService()
+
+
+# === Map View ===
+
+class HexMapCanvas:
+    """
+    Hex map view on a tk.Canvas that only draws hexes inside the viewport.
+
+    Canvas items are pooled: panning scrolls the canvas view and recycles the
+    items of hexes that left the viewport for hexes that entered it, and
+    setHexState only re-colours hexes whose state changed.
+    """
+
+    def __init__(self, parent, hexMap=None, hexSize=14, defaultFill="navy", outline="grey40"):
+        """
+        Args:
+            parent (tk.Widget): Container for the canvas.
+            hexMap (HexMap, optional): Map to display.
+            hexSize (float): Hex corner radius in pixels.
+            defaultFill (str): Fill for hexes with no state set.
+            outline (str): Hex outline colour.
+        """
+        self.canvas = tk.Canvas(parent, bg="black", highlightthickness=0)
+        self.canvas.pack(expand=True, fill="both")
+        self.hexSize = float(hexSize)
+        self.defaultFill = defaultFill
+        self.outline = outline
+        self.hexMap = None
+
+        # Flat-topped hex corner offsets, flattened to x0, y0, x1, y1, ...
+        angles = [math.radians(60 * k) for k in range(6)]
+        self._corners = [v for a in angles for v in (self.hexSize * math.cos(a), self.hexSize * math.sin(a))]
+
+        self._slotForHex = {}  # hexId -> (polygonItem, textItem) currently drawn
+        self._freeSlots = []   # hidden item pairs ready for reuse
+        self._state = {}       # hexId -> (fill, label)
+        self._dirty = set()
+        self._redrawPending = False
+
+        self.canvas.bind("<ButtonPress-1>", lambda e: self.canvas.scan_mark(e.x, e.y))
+        self.canvas.bind("<B1-Motion>", self._onDrag)
+        self.canvas.bind("<Configure>", lambda e: self.scheduleRedraw())
+
+        if hexMap is not None:
+            self.setMap(hexMap)
+
+    def setMap(self, hexMap):
+        """
+        Display a new map, discarding all items and hex state.
+
+        Args:
+            hexMap (HexMap): Map to display.
+        """
+        self.canvas.delete("all")
+        self._slotForHex.clear()
+        self._freeSlots.clear()
+        self._state.clear()
+        self._dirty.clear()
+        self.hexMap = hexMap
+
+        rows, cols = hexMap.shape
+        width = (1.5 * cols + 0.5) * self.hexSize
+        height = (rows + 0.5) * math.sqrt(3) * self.hexSize
+        self.canvas.config(scrollregion=(0, 0, width, height))
+        self.canvas.xview_moveto(0)
+        self.canvas.yview_moveto(0)
+        self.scheduleRedraw()
+
+    def hexCenter(self, row, col):
+        """Return canvas (x, y) of the centre of compact grid cell (row, col)."""
+        sheetRow = 2 * row + (col + self.hexMap.parity) % 2
+        return (self.hexSize * (1 + 1.5 * col),
+                self.hexSize * math.sqrt(3) / 2 * (sheetRow + 1))
+
+    def setHexState(self, hexIds, fill=None, label=""):
+        """
+        Set the fill and label of hexes and redraw only those hexes.
+
+        Args:
+            hexIds (Iterable[int]): Hexes to update.
+            fill (str, optional): Fill colour; None restores the default.
+            label (str): Text drawn on the hex (e.g. unit designator).
+        """
+        for hexId in hexIds:
+            hexId = int(hexId)
+            if fill is None and not label:
+                self._state.pop(hexId, None)
+            else:
+                self._state[hexId] = (fill, label)
+            self._dirty.add(hexId)
+        self.scheduleRedraw()
+
+    def clearHexState(self):
+        """Reset every hex to the default fill with no label."""
+        self._dirty.update(self._state)
+        self._state.clear()
+        self.scheduleRedraw()
+
+    def scheduleRedraw(self):
+        """Coalesce redraw requests into one pass when Tk is idle."""
+        if not self._redrawPending:
+            self._redrawPending = True
+            self.canvas.after_idle(self.redraw)
+
+    def _onDrag(self, event):
+        self.canvas.scan_dragto(event.x, event.y, gain=1)
+        self.scheduleRedraw()
+
+    def _visibleHexes(self):
+        """Return {hexId: (row, col)} for hexes overlapping the viewport."""
+        x0, y0 = self.canvas.canvasx(0), self.canvas.canvasy(0)
+        x1 = self.canvas.canvasx(self.canvas.winfo_width())
+        y1 = self.canvas.canvasy(self.canvas.winfo_height())
+        halfHeight = math.sqrt(3) / 2 * self.hexSize
+
+        rows, cols = self.hexMap.shape
+        c0 = max(0, int((x0 - 2 * self.hexSize) // (1.5 * self.hexSize)))
+        c1 = min(cols, int(x1 // (1.5 * self.hexSize)) + 2)
+        r0 = max(0, int(y0 // halfHeight) // 2 - 1)
+        r1 = min(rows, int(y1 // halfHeight) // 2 + 2)
+        if c0 >= c1 or r0 >= r1:
+            return {}
+
+        window = self.hexMap.ids[r0:r1, c0:c1]
+        hitRows, hitCols = window.nonzero()
+        hexIds = window[hitRows, hitCols].tolist()
+        return dict(zip(hexIds, zip((hitRows + r0).tolist(), (hitCols + c0).tolist())))
+
+    def _applyState(self, hexId, slot):
+        fill, label = self._state.get(hexId, (None, ""))
+        self.canvas.itemconfigure(slot[0], fill=fill or self.defaultFill)
+        self.canvas.itemconfigure(slot[1], text=label)
+
+    def redraw(self):
+        """Draw hexes entering the viewport and re-colour dirty visible hexes."""
+        self._redrawPending = False
+        if self.hexMap is None:
+            return
+
+        visible = self._visibleHexes()
+
+        # Recycle items of hexes that scrolled out of view
+        for hexId in [h for h in self._slotForHex if h not in visible]:
+            slot = self._slotForHex.pop(hexId)
+            self.canvas.itemconfigure(slot[0], state="hidden")
+            self.canvas.itemconfigure(slot[1], state="hidden")
+            self._freeSlots.append(slot)
+
+        for hexId, (row, col) in visible.items():
+            if hexId in self._slotForHex:
+                continue
+            x, y = self.hexCenter(row, col)
+            points = [v + (x if i % 2 == 0 else y) for i, v in enumerate(self._corners)]
+            if self._freeSlots:
+                slot = self._freeSlots.pop()
+                self.canvas.coords(slot[0], *points)
+                self.canvas.coords(slot[1], x, y)
+                self.canvas.itemconfigure(slot[0], state="normal")
+                self.canvas.itemconfigure(slot[1], state="normal")
+            else:
+                slot = (
+                    self.canvas.create_polygon(*points, outline=self.outline, fill=self.defaultFill),
+                    self.canvas.create_text(x, y, fill="white", font=("Arial", max(6, int(self.hexSize / 2))))
+                )
+            self._slotForHex[hexId] = slot
+            self._applyState(hexId, slot)
+            self._dirty.discard(hexId)
+
+        # Hexes outside the view pick up their state when they scroll in
+        for hexId in self._dirty:
+            slot = self._slotForHex.get(hexId)
+            if slot is not None:
+                self._applyState(hexId, slot)
+        self._dirty.clear()
+
+
+def _readMap(filePath):
+    """Load a map workbook (safe off the Tk thread)."""
+    import mapAlgorithmLibrary as mal
+    return mal.mapLoad(filePath)
+
+
+def loadMapIntoView(mapView, mapPathVar, loader=None):
+    """
+    Ask for a map workbook, load it and show it in a HexMapCanvas.
+
+    Args:
+        mapView (HexMapCanvas): View to display the map in.
+        mapPathVar (tk.StringVar): Variable showing the loaded map path.
+        loader (BackgroundLoader, optional): Loader for the workbook read; without
+            one the map is read on the calling thread.
+    """
+    filename = filedialog.askopenfilename(title="Select Map Workbook",
+                                          filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")])
+    if not filename:
+        return
+    previousPath = mapPathVar.get()
+
+    def show(hexMap):
+        mapView.setMap(hexMap)
+        mapPathVar.set(filename)
+
+    def failed(error):
+        mapPathVar.set(previousPath)
+        messagebox.showerror("Error", f"Failed to load map:\n{error}")
+
+    if loader is None:
+        try:
+            hexMap = _readMap(filename)
+        except Exception as e:
+            failed(e)
+            return
+        show(hexMap)
+        return
+    mapPathVar.set(f"Loading {os.path.basename(filename)}...")
+    loader.submit(_readMap, filename, onDone=show, onError=failed,
+                  onCancel=lambda: mapPathVar.set(previousPath))
@@ -0,0 +1,539 @@
+# -*- coding: utf-8 -*-
+"""
+Table-driven adjudication helpers: SME probability tables and capability
+matrices compiled into dense NumPy lookup arrays.
+
+A resource sheet selection -- the (startRow, colIndices) tuples from
+buildFilenamesDictFromTabs, usually loaded with loadResourceTables -- is
+compiled once into a ProbabilityTable. Every categorical axis (platform,
+target, environment modifier, ...) gets integer codes, so a whole move's
+engagements are resolved with one fancy-indexing call instead of a pandas
+row filter per engagement.
+"""
+
+import hashlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+# The sheet loader imports MDW25GuiHeader (and so pandas) only when called.
+
+# === Probability Tables ===
+
+def _label(value):
+    """Normalise a cell or lookup value to a category label ('1' for 1, 1.0 and ' 1 ')."""
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def _isBlank(value):
+    return value is None or (isinstance(value, (float, np.floating)) and np.isnan(value)) or _label(value) == ""
+
+
+def _toFloat(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class ProbabilityTable:
+    """
+    A dense N-dimensional lookup table with categorical axes.
+
+    values[i, j, ...] holds the entry for categories[axes[0]][i],
+    categories[axes[1]][j], ...; combinations the sheet does not list are
+    NaN.
+    """
+
+    def __init__(self, axes, categories, values, name=None):
+        """
+        Args:
+            axes (Sequence[str]): Axis names, in array order.
+            categories (Dict[str, Sequence[str]]): Axis -> labels, in code order.
+            values (np.ndarray): Float array shaped by the category counts.
+            name (str, optional): Table name (e.g. the value column heading).
+
+        Raises:
+            ValueError: If the array shape does not match the categories.
+        """
+        self.axes = tuple(axes)
+        self.categories = {axis: list(categories[axis]) for axis in self.axes}
+        self.values = np.asarray(values, dtype=float)
+        self.name = name
+        shape = tuple(len(self.categories[axis]) for axis in self.axes)
+        if self.values.shape != shape:
+            raise ValueError(f"Values shape {self.values.shape} does not match categories {shape}")
+        self._codes = {axis: {label: code for code, label in enumerate(self.categories[axis])}
+                       for axis in self.axes}
+
+    @property
+    def shape(self):
+        """Tuple[int, ...]: Category count per axis."""
+        return self.values.shape
+
+    def __repr__(self):
+        axes = ", ".join(f"{axis}={len(self.categories[axis])}" for axis in self.axes)
+        return f"ProbabilityTable({self.name or 'unnamed'}: {axes})"
+
+    def encode(self, axis, labels):
+        """
+        Map labels to integer codes for one axis.
+
+        Args:
+            axis (str): Axis name.
+            labels (scalar or array-like): Category labels.
+
+        Returns:
+            np.ndarray: Codes (np.intp) shaped like labels; -1 for unknown labels.
+
+        Raises:
+            KeyError: If the axis does not exist.
+        """
+        mapping = self._codes[axis]
+        labels = np.asarray(labels, dtype=object)  # Keep 1.0 a float: a mixed list would otherwise become '1.0'
+        try:
+            uniques, inverse = np.unique(labels, return_inverse=True)
+        except TypeError:  # Mixed label types cannot be sorted; encode one by one
+            codes = [mapping.get(_label(label), -1) for label in labels.ravel().tolist()]
+            return np.array(codes, dtype=np.intp).reshape(labels.shape)
+        uniqueCodes = np.array([mapping.get(_label(label), -1) for label in uniques.tolist()], dtype=np.intp)
+        return uniqueCodes[inverse].reshape(labels.shape)
+
+    def decode(self, axis, codes):
+        """
+        Map codes back to labels for one axis.
+
+        Args:
+            axis (str): Axis name.
+            codes (array-like): Codes from encode (-1 decodes to None).
+
+        Returns:
+            np.ndarray: Object array of labels.
+        """
+        labels = np.array(self.categories[axis] + [None], dtype=object)
+        return labels[np.asarray(codes, dtype=np.intp)]
+
+    def lookupCodes(self, *codes, fill=np.nan):
+        """
+        Look up pre-encoded engagements with one fancy-indexing call.
+
+        Args:
+            *codes (array-like): One code array per axis, broadcast together.
+            fill (float): Value for unknown (-1) codes.
+
+        Returns:
+            np.ndarray: Float values shaped like the broadcast codes.
+
+        Raises:
+            ValueError: If the number of code arrays does not match the axes.
+        """
+        if len(codes) != len(self.axes):
+            raise ValueError(f"Expected {len(self.axes)} code arrays ({', '.join(self.axes)}), got {len(codes)}")
+        codes = np.broadcast_arrays(*[np.asarray(c, dtype=np.intp) for c in codes])
+        known = np.ones(codes[0].shape, dtype=bool)
+        for c in codes:
+            known &= c >= 0
+        result = self.values[tuple(np.where(known, c, 0) for c in codes)]
+        if not known.all():
+            result = np.where(known, result, fill)
+        return result
+
+    def lookup(self, *labels, fill=np.nan, **axisLabels):
+        """
+        Look up engagements by category label.
+
+        Args:
+            *labels (scalar or array-like): Labels per axis, in axis order.
+            fill (float): Value for unknown labels.
+            **axisLabels: Labels by axis name (instead of positionally).
+
+        Returns:
+            np.ndarray: Float values shaped like the broadcast labels.
+        """
+        if axisLabels:
+            labels = labels + tuple(axisLabels[axis] for axis in self.axes[len(labels):])
+        return self.lookupCodes(*(self.encode(axis, l) for axis, l in zip(self.axes, labels)), fill=fill)
+
+
+def _cellArray(cells):
+    """Return raw sheet cells (DataFrame or 2-D array-like) as a 2-D object array."""
+    if hasattr(cells, "to_numpy"):
+        cells = cells.to_numpy(dtype=object)
+    cells = np.asarray(cells, dtype=object)
+    if cells.ndim != 2:
+        raise ValueError("Sheet cells must be two-dimensional")
+    return cells
+
+
+def _headings(cells):
+    """Return the heading row of a selection, naming blank headings Column1, Column2, ..."""
+    return [_label(h) if not _isBlank(h) else f"Column{i + 1}" for i, h in enumerate(cells[0])]
+
+
+def _columnPosition(header, column):
+    """Resolve a column given by heading (str) or position within the selection (int)."""
+    if isinstance(column, (int, np.integer)):
+        if not 0 <= column < len(header) and not -len(header) <= column < 0:
+            raise ValueError(f"Column {column} is outside the selection ({len(header)} columns)")
+        return int(column) % len(header)
+    matches = [i for i, heading in enumerate(header) if heading.lower() == str(column).strip().lower()]
+    if not matches:
+        raise ValueError(f"Column '{column}' not found in headings {header}")
+    return matches[0]
+
+
+def compileProbabilityTable(cells, axisColumns, valueColumn=-1, name=None):
+    """
+    Compile a long-format SME table (one row per combination) into a ProbabilityTable.
+
+    The first row of the selection holds the column headings; each later
+    row lists one combination of axis categories and its value, e.g.
+    Platform | Target | Sea State | Pk. Blank rows are skipped.
+
+    Args:
+        cells (DataFrame | array-like): Raw cells of the sheet selection
+            (as returned by readSheetTable / loadResourceTables).
+        axisColumns (Sequence[str | int]): Axis columns by heading or by
+            position within the selection.
+        valueColumn (str | int): Value column by heading or position (default: last).
+        name (str, optional): Table name; defaults to the value column heading.
+
+    Returns:
+        ProbabilityTable: Compiled table; axes are named by their headings.
+
+    Raises:
+        ValueError: If columns are missing, a combination is listed twice
+            or a value is not numeric.
+    """
+    cells = _cellArray(cells)
+    if cells.shape[0] < 2:
+        raise ValueError("Table needs a heading row and at least one data row")
+    header = _headings(cells)
+    axisPositions = [_columnPosition(header, column) for column in axisColumns]
+    valuePosition = _columnPosition(header, valueColumn)
+    axes = [header[p] for p in axisPositions]
+
+    rows = [row for row in cells[1:] if not all(_isBlank(row[p]) for p in axisPositions)]
+    if not rows:
+        raise ValueError("Table has no data rows")
+    categories = {axis: [] for axis in axes}
+    codes = np.empty((len(rows), len(axes)), dtype=np.intp)
+    lookups = [{} for _ in axes]
+    for rowIdx, row in enumerate(rows):
+        for axisIdx, position in enumerate(axisPositions):
+            label = _label(row[position])
+            code = lookups[axisIdx].get(label)
+            if code is None:
+                code = lookups[axisIdx][label] = len(categories[axes[axisIdx]])
+                categories[axes[axisIdx]].append(label)
+            codes[rowIdx, axisIdx] = code
+
+    rawValues = [row[valuePosition] for row in rows]
+    values = np.array([_toFloat(v) for v in rawValues], dtype=float)
+    bad = [v for v, f in zip(rawValues, values) if np.isnan(f) and not _isBlank(v)]
+    if bad:
+        raise ValueError(f"Non-numeric values in column '{header[valuePosition]}': {bad[:5]}")
+
+    flat = np.ravel_multi_index(tuple(codes.T), tuple(len(categories[axis]) for axis in axes))
+    if len(np.unique(flat)) != len(flat):
+        seen, duplicate = set(), None
+        for rowIdx, key in enumerate(flat.tolist()):
+            if key in seen:
+                duplicate = [_label(rows[rowIdx][p]) for p in axisPositions]
+                break
+            seen.add(key)
+        raise ValueError(f"Combination {duplicate} is listed more than once")
+
+    table = np.full(tuple(len(categories[axis]) for axis in axes), np.nan)
+    table.ravel()[flat] = values
+    return ProbabilityTable(axes, categories, table, name or header[valuePosition])
+
+
+def compileMatrixTable(cells, rowAxis=None, columnAxis="Column", name=None):
+    """
+    Compile a wide-format capability matrix into a 2-D ProbabilityTable.
+
+    The first row holds the column categories (its first cell names the row
+    axis), and the first column holds the row categories, e.g. platforms
+    down the side and targets across the top.
+
+    Args:
+        cells (DataFrame | array-like): Raw cells of the sheet selection.
+        rowAxis (str, optional): Row axis name; defaults to the top-left cell.
+        columnAxis (str): Column axis name.
+        name (str, optional): Table name.
+
+    Returns:
+        ProbabilityTable: Table with axes (rowAxis, columnAxis).
+
+    Raises:
+        ValueError: If a category repeats or a cell is not numeric.
+    """
+    cells = _cellArray(cells)
+    if cells.shape[0] < 2 or cells.shape[1] < 2:
+        raise ValueError("Matrix needs a heading row, a heading column and at least one value")
+    rowAxis = rowAxis or (_label(cells[0, 0]) if not _isBlank(cells[0, 0]) else "Row")
+
+    keepCols = [j for j in range(1, cells.shape[1]) if not _isBlank(cells[0, j])]
+    keepRows = [i for i in range(1, cells.shape[0]) if not _isBlank(cells[i, 0])]
+    columnLabels = [_label(cells[0, j]) for j in keepCols]
+    rowLabels = [_label(cells[i, 0]) for i in keepRows]
+    for axis, labels in ((rowAxis, rowLabels), (columnAxis, columnLabels)):
+        if len(set(labels)) != len(labels):
+            raise ValueError(f"Repeated {axis} categories in matrix")
+
+    raw = cells[np.ix_(keepRows, keepCols)]
+    values = np.array([[_toFloat(v) for v in row] for row in raw], dtype=float).reshape(raw.shape)
+    bad = [v for v, f in zip(raw.ravel().tolist(), values.ravel().tolist()) if np.isnan(f) and not _isBlank(v)]
+    if bad:
+        raise ValueError(f"Non-numeric matrix cells: {bad[:5]}")
+    return ProbabilityTable((rowAxis, columnAxis), {rowAxis: rowLabels, columnAxis: columnLabels}, values, name)
+
+
+def loadProbabilityTable(filePath, sheetName, selection=(0, None), axisColumns=None, valueColumn=-1,
+                         layout="long", name=None):
+    """
+    Read one resource sheet selection and compile it.
+
+    The cells come from MDW25GuiHeader.readSheetTable, so the read shares the
+    workbook cache and the content-hashed resource table cache.
+
+    Args:
+        filePath (str): Workbook path.
+        sheetName (str): Sheet to read.
+        selection (Tuple[int, List[int]]): (zero-based startRow, colIndices) as in
+            buildFilenamesDictFromTabs; colIndices None reads A:Z.
+        axisColumns (Sequence[str | int], optional): Axis columns for the long
+            layout; defaults to every column except the value column.
+        valueColumn (str | int): Value column for the long layout.
+        layout (str): "long" (one row per combination) or "matrix".
+        name (str, optional): Table name; defaults to the sheet name for matrices.
+
+    Returns:
+        ProbabilityTable: Compiled table.
+
+    Raises:
+        ValueError: If the layout is unknown or the sheet does not compile.
+    """
+    import MDW25GuiHeader as gui  # Local import: compiled tables need only numpy
+
+    startRow, colIndices = selection
+    cells = gui.readSheetTable(filePath, sheetName, startRow, colIndices)
+    return compileSheetCells(cells, layout, axisColumns, valueColumn, name or sheetName)
+
+
+def compileSheetCells(cells, layout="long", axisColumns=None, valueColumn=-1, name=None):
+    """
+    Compile already-loaded sheet cells (e.g. one loadResourceTables entry).
+
+    Args:
+        cells (DataFrame | array-like): Raw cells of the sheet selection.
+        layout (str): "long" or "matrix".
+        axisColumns (Sequence[str | int], optional): Axis columns for the long
+            layout; defaults to every column except the value column.
+        valueColumn (str | int): Value column for the long layout.
+        name (str, optional): Table name.
+
+    Returns:
+        ProbabilityTable: Compiled table.
+
+    Raises:
+        ValueError: If the layout is unknown or the cells do not compile.
+    """
+    if layout == "matrix":
+        return compileMatrixTable(cells, name=name)
+    if layout != "long":
+        raise ValueError(f"Unknown table layout '{layout}'")
+    if axisColumns is None:
+        header = _headings(_cellArray(cells))
+        valuePosition = _columnPosition(header, valueColumn)
+        axisColumns = [i for i in range(len(header)) if i != valuePosition]
+    return compileProbabilityTable(cells, axisColumns, valueColumn, name)
+
+
+# === Monte Carlo Resolution ===
+
+# Philox4x32-10 constants (Salmon et al., "Parallel Random Numbers: As Easy as 1, 2, 3")
+_PHILOX_M0 = np.uint64(0xD2511F53)
+_PHILOX_M1 = np.uint64(0xCD9E8D57)
+_PHILOX_W0 = 0x9E3779B9
+_PHILOX_W1 = 0xBB67AE85
+_MASK32 = np.uint64(0xFFFFFFFF)
+
+RESOLVE_CHUNK_SIZE = 1 << 16  # Engagements per chunk (bounds temporary memory)
+
+
+def philox4x32(counters, key, rounds=10):
+    """
+    Apply the Philox4x32 block function to many counters at once.
+
+    Args:
+        counters (np.ndarray): (N, 4) unsigned 32-bit counter words.
+        key (Tuple[int, int]): Two 32-bit key words.
+        rounds (int): Number of rounds (10 is the standard variant).
+
+    Returns:
+        np.ndarray: (N, 4) uint32 random words.
+    """
+    c = np.asarray(counters, dtype=np.uint64).T.copy()
+    k0, k1 = int(key[0]) & 0xFFFFFFFF, int(key[1]) & 0xFFFFFFFF
+    for _ in range(rounds):
+        p0 = c[0] * _PHILOX_M0
+        p1 = c[2] * _PHILOX_M1
+        c = np.stack([
+            (p1 >> np.uint64(32)) ^ c[1] ^ np.uint64(k0),
+            p1 & _MASK32,
+            (p0 >> np.uint64(32)) ^ c[3] ^ np.uint64(k1),
+            p0 & _MASK32,
+        ])
+        k0 = (k0 + _PHILOX_W0) & 0xFFFFFFFF
+        k1 = (k1 + _PHILOX_W1) & 0xFFFFFFFF
+    return c.T.astype(np.uint32)
+
+
+def engagementKey(label):
+    """
+    Turn a non-integer engagement identifier into a stable 63-bit ID.
+
+    Uses BLAKE2b rather than hash(), which changes between Python runs.
+
+    Args:
+        label (str): Engagement identifier (e.g. "M3-BLUE-017").
+
+    Returns:
+        int: Engagement ID for engagementUniforms.
+    """
+    digest = hashlib.blake2b(str(label).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") >> 1
+
+
+def currentMoveNumber(cheatSheetPath):
+    """
+    Read the current move number from the cheat sheet's "Move N" entries.
+
+    incrementAllMoveNumbers bumps every "Move N" after each run, so the
+    largest N is the move being adjudicated.
+
+    Args:
+        cheatSheetPath (str): Cheat sheet path.
+
+    Returns:
+        int | None: Largest move number, or None if the sheet has none.
+    """
+    with open(cheatSheetPath, "r") as f:
+        numbers = [int(n) for n in re.findall(r"Move (\d+)", f.read())]
+    return max(numbers) if numbers else None
+
+
+def _uniformChunk(key, moveNumber, ids, draws):
+    blocks = (draws + 1) // 2  # Each Philox block yields two doubles
+    counters = np.empty((len(ids), blocks, 4), dtype=np.uint64)
+    counters[:, :, 0] = np.arange(blocks, dtype=np.uint64)
+    counters[:, :, 1] = (ids & _MASK32)[:, None]
+    counters[:, :, 2] = (ids >> np.uint64(32))[:, None]
+    counters[:, :, 3] = np.uint64(moveNumber)
+    words = philox4x32(counters.reshape(-1, 4), key).astype(np.uint64).reshape(len(ids), blocks * 2, 2)
+    # 53-bit doubles from two 32-bit words, as in numpy/Random123
+    uniforms = ((words[..., 0] >> np.uint64(5)) * np.uint64(1 << 26) + (words[..., 1] >> np.uint64(6))) \
+        * (1.0 / (1 << 53))
+    return uniforms[:, :draws]
+
+
+def engagementUniforms(seed, moveNumber, engagementIds, draws=1, maxWorkers=1, chunkSize=RESOLVE_CHUNK_SIZE):
+    """
+    Draw uniform [0, 1) rolls for a batch of engagements.
+
+    Roll d of an engagement is a pure function of (seed, moveNumber,
+    engagementId, d): the seed is the Philox key and the other three form
+    the counter. An engagement gets the same rolls whatever else is in the
+    batch, in whatever order, chunking or number of workers.
+
+    Args:
+        seed (int): Scenario seed, 0 <= seed < 2**64.
+        moveNumber (int): Move number, 0 <= moveNumber < 2**32.
+        engagementIds (array-like): Non-negative integer IDs, unique per
+            engagement within a move (see engagementKey for string IDs).
+        draws (int): Rolls per engagement.
+        maxWorkers (int): Threads resolving chunks concurrently.
+        chunkSize (int): Engagements per chunk.
+
+    Returns:
+        np.ndarray: (N, draws) float64 rolls.
+
+    Raises:
+        ValueError: If the seed, move number or IDs are out of range.
+    """
+    seed, moveNumber, draws = int(seed), int(moveNumber), int(draws)
+    if not 0 <= seed < 1 << 64:
+        raise ValueError("Seed must be in [0, 2**64)")
+    if not 0 <= moveNumber < 1 << 32:
+        raise ValueError("Move number must be in [0, 2**32)")
+    if draws < 1:
+        raise ValueError("draws must be at least 1")
+    ids = np.asarray(engagementIds).ravel()
+    if ids.dtype.kind == "i" and ids.size and ids.min() < 0:
+        raise ValueError("Engagement IDs must be non-negative")
+    if ids.dtype.kind not in "iu" and ids.size:
+        raise ValueError("Engagement IDs must be integers (see engagementKey)")
+    ids = ids.astype(np.uint64)
+    key = (seed & 0xFFFFFFFF, seed >> 32)
+
+    chunkSize = max(1, int(chunkSize))
+    starts = range(0, len(ids), chunkSize)
+    task = lambda start: _uniformChunk(key, moveNumber, ids[start:start + chunkSize], draws)
+    if maxWorkers > 1 and len(starts) > 1:
+        with ThreadPoolExecutor(max_workers=maxWorkers) as pool:
+            parts = list(pool.map(task, starts))
+    else:
+        parts = [task(start) for start in starts]
+    return np.concatenate(parts) if parts else np.empty((0, draws))
+
+
+def resolveEngagements(probabilities, seed, moveNumber, engagementIds, draws=1, maxWorkers=1):
+    """
+    Resolve a batch of engagements: roll d succeeds when its roll < probability.
+
+    Args:
+        probabilities (array-like): Success probability per engagement (NaN never succeeds).
+        seed (int): Scenario seed.
+        moveNumber (int): Move number (see currentMoveNumber).
+        engagementIds (array-like): Integer engagement IDs.
+        draws (int): Independent rolls per engagement (e.g. shots in a salvo).
+        maxWorkers (int): Threads used to draw rolls.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (N, draws) bool outcomes and the float rolls.
+
+    Raises:
+        ValueError: If probabilities and IDs differ in length.
+    """
+    probabilities = np.asarray(probabilities, dtype=float).ravel()
+    if len(probabilities) != np.size(engagementIds):
+        raise ValueError("Need one probability per engagement")
+    rolls = engagementUniforms(seed, moveNumber, engagementIds, draws, maxWorkers)
+    with np.errstate(invalid="ignore"):
+        outcomes = rolls < probabilities[:, None]
+    return outcomes, rolls
+
+
+def resolveWithTable(table, seed, moveNumber, engagementIds, *labels, draws=1, maxWorkers=1):
+    """
+    Look engagements up in a ProbabilityTable and resolve them in one batch.
+
+    Args:
+        table (ProbabilityTable): Compiled probability table.
+        seed (int): Scenario seed.
+        moveNumber (int): Move number.
+        engagementIds (array-like): Integer engagement IDs.
+        *labels (array-like): Category labels per table axis, one per engagement.
+        draws (int): Rolls per engagement.
+        maxWorkers (int): Threads used to draw rolls.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Outcomes, rolls and the looked-up probabilities.
+    """
+    probabilities = np.broadcast_to(table.lookup(*labels), (np.size(engagementIds),))
+    outcomes, rolls = resolveEngagements(probabilities, seed, moveNumber, engagementIds, draws, maxWorkers)
+    return outcomes, rolls, probabilities
@@ -7,4 +7,6 @@ Created on Thu Mar 20 08:16:12 2025
 
 import mapAlgorithmLibrary as mal
 
-mal.mapLoad("mapExample.xlsx")
\ No newline at end of file
+hexMap = mal.mapLoad("mapExample.xlsx")
+print(hexMap)
+print(hexMap.ids)
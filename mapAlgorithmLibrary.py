@@ -5,18 +5,1086 @@ Created on Thu Mar 20 08:25:39 2025
 @author: mitch.lautigar
 """
 
-import pandas as pb
-
-def mapLoad(fName):
-    data2Load = pb.read_excel(fName,names=None,header=None)
-    mapWidth = len(data2Load.columns)
-    mapHeight = len(data2Load)
-    rowStack = []
-    mapStack = []
-    for ii in range(0,mapHeight): #columns
-        for jj in range(0,mapWidth): #rows
-            rowStack.append(str(data2Load[jj][ii]))
-        mapStack.append(rowStack)
-        rowStack = []
-    print(mapStack)
-        
\ No newline at end of file
+import collections
+import functools
+import hashlib
+import heapq
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+# pandas and openpyxl are imported by the loaders that use them; most callers
+# only need the numpy-based map model and algorithms.
+
+# Axial (dq, dr) steps to the six neighbours of a hex
+AXIAL_DIRECTIONS = np.array([(1, 0), (1, -1), (0, -1), (-1, 0), (-1, 1), (0, 1)], dtype=np.int64)
+
+# Hex ID lookups use a dense array while maxId < DENSE_SLOT_RATIO * hexes +
+# DENSE_SLOT_MIN, and a binary search of the sorted IDs for sparser numbering
+DENSE_SLOT_RATIO = 8
+DENSE_SLOT_MIN = 1 << 16
+
+# === Hex Map Model ===
+
+class HexMap:
+    """
+    Array-backed hex map built from a map workbook.
+
+    Map sheets use a doubled-height layout: every sheet column is a column of
+    flat-topped hexes, and hexes sit on alternating sheet rows with '-' (or 0)
+    placeholders in the cells between them (see mapExample.xlsx). HexMap drops
+    the placeholders and keeps the IDs in a compact grid where grid row k holds
+    sheet rows 2k and 2k+1.
+
+    Attributes:
+        ids (np.ndarray): Compact (rows, cols) grid of hex IDs, 0 where empty.
+        parity (int): (sheetRow + sheetCol) % 2 shared by every occupied cell.
+        hexIds (np.ndarray): Sorted hex IDs present on the map.
+        coords (np.ndarray): (N, 4) array of (row, col, q, r) aligned with hexIds,
+            where row/col index the compact grid and q/r are axial coordinates.
+        origin (Tuple[int, int]): Position of ids[0, 0] in the full map grid.
+    """
+
+    def __init__(self, ids, parity=0, origin=(0, 0)):
+        """
+        Build the hex-ID index for a compact ID grid.
+
+        Args:
+            ids (np.ndarray): Compact 2D grid of hex IDs, 0 where there is no hex.
+            parity (int): (sheetRow + sheetCol) % 2 of occupied sheet cells.
+            origin (Tuple[int, int]): Compact (row, col) of ids[0, 0] in the full
+                map, for maps loaded from a bounding box.
+
+        Raises:
+            ValueError: If a hex ID appears more than once.
+        """
+        self.ids = np.asarray(ids)
+        self.parity = int(parity) % 2
+        self.origin = tuple(origin)
+
+        rows, cols = np.nonzero(self.ids)
+        hexIds = self.ids[rows, cols].astype(np.int64)
+        order = np.argsort(hexIds, kind="stable")
+        hexIds, rows, cols = hexIds[order], rows[order], cols[order]
+
+        if len(hexIds) > 1 and np.any(hexIds[1:] == hexIds[:-1]):
+            dupes = np.unique(hexIds[1:][hexIds[1:] == hexIds[:-1]])
+            raise ValueError(f"Duplicate hex IDs in map: {dupes[:10].tolist()}")
+
+        sheetRows = 2 * rows + (cols + self.parity) % 2
+        q = cols
+        r = (sheetRows - cols - self.parity) // 2
+
+        self.hexIds = hexIds.astype(self.ids.dtype)
+        self.coords = np.stack([rows, cols, q, r], axis=1).astype(np.int32)
+
+        # Dense ID -> position lookup so batches of IDs resolve in one indexing call;
+        # sparse IDs (e.g. long CCRR codes) use a binary search of hexIds instead
+        self._sortedIds = hexIds
+        maxId = int(hexIds[-1]) if len(hexIds) else 0
+        if maxId < DENSE_SLOT_RATIO * len(hexIds) + DENSE_SLOT_MIN:
+            self._slot = np.full(maxId + 1, -1, dtype=np.int32)
+            self._slot[hexIds] = np.arange(len(hexIds))
+        else:
+            self._slot = None
+        self._neighbors = None
+
+    @classmethod
+    def fromGrid(cls, grid):
+        """
+        Build a HexMap from the raw cell values of a map sheet.
+
+        Args:
+            grid (array-like): 2D sheet cell values; hex IDs are positive numbers,
+                anything else ('-', 0, blank) is a placeholder.
+
+        Returns:
+            HexMap: Map holding the IDs found in the grid.
+
+        Raises:
+            ValueError: If the occupied cells do not form a doubled-height layout.
+        """
+        values = np.asarray(grid, dtype=object)
+        if values.ndim != 2:
+            raise ValueError("Map grid must be two-dimensional.")
+
+        numeric = _numericCells(values)
+        maxId = np.nanmax(numeric, initial=0)
+        idDtype = np.int32 if maxId <= np.iinfo(np.int32).max else np.int64
+        ids = np.zeros(((values.shape[0] + 1) // 2, values.shape[1]), dtype=idDtype)
+        parity = _placeHexes(numeric, ids, 0, None)
+
+        return cls(ids, parity or 0)
+
+    @property
+    def shape(self):
+        """Tuple[int, int]: Shape of the compact ID grid."""
+        return self.ids.shape
+
+    def __len__(self):
+        return len(self.hexIds)
+
+    def __contains__(self, hexId):
+        try:
+            hexId = np.array([int(hexId)], dtype=np.int64)
+        except (TypeError, ValueError, OverflowError):
+            return False
+        return bool(self._lookupSlots(hexId)[0] >= 0)
+
+    def __repr__(self):
+        return f"HexMap(hexes={len(self)}, shape={self.shape}, parity={self.parity})"
+
+    def _lookupSlots(self, hexIds):
+        """Return positions of int64 hex IDs, -1 for IDs not on the map."""
+        slot = np.full(hexIds.shape, -1, dtype=np.int64)
+        if self._slot is not None:
+            inRange = (hexIds >= 0) & (hexIds < len(self._slot))
+            slot[inRange] = self._slot[hexIds[inRange]]
+        elif len(self._sortedIds):
+            pos = np.minimum(np.searchsorted(self._sortedIds, hexIds), len(self._sortedIds) - 1)
+            found = self._sortedIds[pos] == hexIds
+            slot[found] = pos[found]
+        return slot
+
+    def slots(self, hexIds):
+        """
+        Return positions of hex IDs within hexIds/coords.
+
+        Args:
+            hexIds (array-like): Hex IDs of any shape.
+
+        Returns:
+            np.ndarray: Positions with the same shape as hexIds.
+
+        Raises:
+            ValueError: If any ID is not on the map.
+        """
+        hexIds = np.asarray(hexIds, dtype=np.int64)
+        slot = self._lookupSlots(hexIds)
+        if np.any(slot < 0):
+            missing = np.unique(hexIds[slot < 0])
+            raise ValueError(f"Hex IDs not on map: {missing[:10].tolist()}")
+        return slot
+
+    def locate(self, hexIds):
+        """
+        Look up (row, col, q, r) for one or more hex IDs.
+
+        Args:
+            hexIds (array-like): Hex IDs of any shape.
+
+        Returns:
+            np.ndarray: Array of shape hexIds.shape + (4,).
+        """
+        return self.coords[self.slots(hexIds)]
+
+    def axial(self, hexIds):
+        """
+        Return axial (q, r) coordinates for one or more hex IDs.
+
+        Args:
+            hexIds (array-like): Hex IDs of any shape.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: q and r arrays shaped like hexIds.
+        """
+        coords = self.locate(hexIds)
+        return coords[..., 2], coords[..., 3]
+
+    def sheetCell(self, hexIds):
+        """
+        Return zero-based (sheetRow, sheetCol) of hex IDs in the source workbook.
+
+        Args:
+            hexIds (array-like): Hex IDs of any shape.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Sheet row and column arrays.
+        """
+        coords = self.locate(hexIds)
+        rows, cols = coords[..., 0], coords[..., 1]
+        return 2 * rows + (cols + self.parity) % 2, cols
+
+    def axialToId(self, q, r):
+        """
+        Return the hex IDs at axial coordinates, 0 where off-map or empty.
+
+        Args:
+            q, r (array-like): Axial coordinates (broadcast against each other).
+
+        Returns:
+            np.ndarray: Hex IDs with the broadcast shape of q and r.
+        """
+        q, r = np.broadcast_arrays(np.asarray(q, dtype=np.int64), np.asarray(r, dtype=np.int64))
+        rows = (2 * r + q + self.parity) // 2
+        inside = (q >= 0) & (q < self.ids.shape[1]) & (rows >= 0) & (rows < self.ids.shape[0])
+        out = np.zeros(q.shape, dtype=self.ids.dtype)
+        out[inside] = self.ids[rows[inside], q[inside]]
+        return out
+
+    def neighborSlots(self):
+        """
+        Return the (N, 6) table of neighbouring hex positions, -1 where off-map.
+
+        Rows align with hexIds/coords; the table is built once and reused.
+
+        Returns:
+            np.ndarray: Neighbour positions for every hex.
+        """
+        if self._neighbors is None:
+            q = self.coords[:, 2, None] + AXIAL_DIRECTIONS[None, :, 0]
+            r = self.coords[:, 3, None] + AXIAL_DIRECTIONS[None, :, 1]
+            neighborIds = self.axialToId(q, r)
+            neighbors = np.full(neighborIds.shape, -1, dtype=np.int32)
+            onMap = neighborIds != 0
+            neighbors[onMap] = self._lookupSlots(neighborIds[onMap].astype(np.int64))
+            self._neighbors = neighbors
+        return self._neighbors
+
+
+# === Map Loading ===
+
+def _numericCells(values):
+    """Convert sheet cell values to floats, NaN for placeholders and text."""
+    import pandas as pb
+
+    values = np.asarray(values, dtype=object)
+    numeric = pb.to_numeric(pb.Series(values.ravel()), errors="coerce")
+    return numeric.to_numpy(dtype=float, na_value=np.nan).reshape(values.shape)
+
+
+def _placeHexes(numeric, ids, rowOffset, parity):
+    """
+    Write the hex IDs found in a block of sheet rows into a compact ID grid.
+
+    Args:
+        numeric (np.ndarray): Numeric sheet cells; the block must start on an
+            even sheet row relative to the grid.
+        ids (np.ndarray): Compact ID grid to fill.
+        rowOffset (int): Compact grid row of the block's first sheet row pair.
+        parity (int | None): Parity found so far, or None if no hex seen yet.
+
+    Returns:
+        int | None: Parity of the occupied cells.
+
+    Raises:
+        ValueError: If the cells break the doubled-height layout or hold
+            non-integer IDs.
+    """
+    sheetRows, sheetCols = np.nonzero(np.isfinite(numeric) & (numeric > 0))
+    if not len(sheetRows):
+        return parity
+
+    parities = (sheetRows + sheetCols) % 2
+    if parity is None:
+        parity = int(parities[0])
+    if np.any(parities != parity):
+        raise ValueError("Map sheet is not a doubled-height hex layout "
+                         "(hexes must sit on alternating rows in each column).")
+
+    hexIds = numeric[sheetRows, sheetCols]
+    if np.any(hexIds != np.floor(hexIds)):
+        raise ValueError("Hex IDs must be whole numbers.")
+
+    ids[rowOffset + sheetRows // 2, sheetCols] = hexIds.astype(ids.dtype)
+    return parity
+
+
+MAP_CACHE_VERSION = 1
+
+
+def mapCachePaths(fName):
+    """
+    Return the (array, metadata) cache file paths kept next to a map workbook.
+
+    Args:
+        fName (str): Path to the map workbook.
+
+    Returns:
+        Tuple[str, str]: Paths of the .npy ID grid and its .json key file.
+    """
+    stem = os.path.abspath(fName) + ".hexmap"
+    return stem + ".npy", stem + ".json"
+
+
+def _fileDigest(fName, blockSize=1 << 20):
+    digest = hashlib.sha256()
+    with open(fName, "rb") as f:
+        for block in iter(lambda: f.read(blockSize), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _readMapCache(fName, stat):
+    """
+    Return the cached HexMap for a workbook, or None if the cache is stale.
+
+    Size and mtime matching is trusted as-is; if only the mtime moved (e.g. the
+    file was copied or re-saved unchanged) the content hash decides.
+    """
+    arrayPath, metaPath = mapCachePaths(fName)
+    try:
+        with open(metaPath, "r") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (meta.get("version") != MAP_CACHE_VERSION
+            or meta.get("path") != os.path.abspath(fName)
+            or meta.get("size") != stat.st_size):
+        return None
+    if meta.get("mtime_ns") != stat.st_mtime_ns:
+        if meta.get("sha256") != _fileDigest(fName):
+            return None
+        meta["mtime_ns"] = stat.st_mtime_ns
+        _writeJsonAtomic(metaPath, meta)
+
+    try:
+        ids = np.load(arrayPath, mmap_mode="r")
+    except (OSError, ValueError):
+        return None
+    return HexMap(ids, meta["parity"])
+
+
+def _writeJsonAtomic(path, data):
+    with tempfile.NamedTemporaryFile("w", dir=os.path.dirname(path), delete=False) as tmpFile:
+        json.dump(data, tmpFile)
+        tempName = tmpFile.name
+    os.replace(tempName, path)
+
+
+def _writeMapCache(fName, stat, hexMap):
+    """Write the compiled ID grid and its key next to the workbook."""
+    arrayPath, metaPath = mapCachePaths(fName)
+    try:
+        with tempfile.NamedTemporaryFile("wb", dir=os.path.dirname(arrayPath), delete=False) as tmpFile:
+            np.save(tmpFile, np.ascontiguousarray(hexMap.ids))
+            tempName = tmpFile.name
+        os.replace(tempName, arrayPath)
+        _writeJsonAtomic(metaPath, {
+            "version": MAP_CACHE_VERSION,
+            "path": os.path.abspath(fName),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": _fileDigest(fName),
+            "parity": hexMap.parity,
+        })
+    except OSError as e:
+        print(f"Could not write map cache for {fName}: {e}")
+
+
+def mapLoad(fName, useCache=True):
+    """
+    Load a hex map workbook into a HexMap.
+
+    With useCache, the compiled ID grid is stored next to the workbook
+    (see mapCachePaths) and memory-mapped on later loads, so the workbook is
+    only parsed again after its size, mtime and content hash change.
+
+    Args:
+        fName (str): Path to the map workbook (first sheet is used).
+        useCache (bool): Read and write the binary map cache.
+
+    Returns:
+        HexMap: Loaded map.
+    """
+    if useCache:
+        stat = os.stat(fName)
+        cached = _readMapCache(fName, stat)
+        if cached is not None:
+            return cached
+
+    import pandas as pb
+
+    data2Load = pb.read_excel(fName, names=None, header=None)
+    hexMap = HexMap.fromGrid(data2Load.to_numpy())
+
+    if useCache:
+        _writeMapCache(fName, stat, hexMap)
+    return hexMap
+
+
+def _sheetExtent(ws):
+    """Return (maxRow, maxCol) of a read-only sheet, scanning it if unsized."""
+    if ws.max_row is not None and ws.max_column is not None:
+        return ws.max_row, ws.max_column
+    ws.reset_dimensions()
+    maxRow = maxCol = 0
+    for rowIdx, row in enumerate(ws.iter_rows(values_only=True), start=1):
+        filled = [i for i, v in enumerate(row, start=1) if v is not None]
+        if filled:
+            maxRow, maxCol = rowIdx, max(maxCol, filled[-1])
+    return maxRow, maxCol
+
+
+def mapLoadTiled(fName, bbox=None, tileSize=256, sheetName=None):
+    """
+    Stream a map workbook into a HexMap one tile band at a time.
+
+    Rows are streamed with openpyxl in read-only mode and converted in bands
+    of tileSize hex rows (2 * tileSize sheet rows) across the requested width,
+    so peak memory is one band of cells plus the compact output grid. A
+    bounding box limits both the rows streamed and the columns kept.
+
+    Args:
+        fName (str): Path to the map workbook.
+        bbox (Tuple[int, int, int, int], optional): (rowStart, colStart, rowStop,
+            colStop) in compact hex-grid coordinates, stops exclusive. Defaults
+            to the whole sheet.
+        tileSize (int): Hex rows converted per band.
+        sheetName (str, optional): Sheet to read; defaults to the first sheet.
+
+    Returns:
+        HexMap: Map of the box, with origin set to (rowStart, colStart). Axial
+        coordinates are relative to that origin.
+    """
+    import openpyxl
+
+    tileSize = max(1, int(tileSize))
+    workbook = openpyxl.load_workbook(fName, read_only=True, data_only=True)
+    try:
+        ws = workbook[sheetName] if sheetName else workbook.worksheets[0]
+        maxRow, maxCol = _sheetExtent(ws)
+        fullRows = (maxRow + 1) // 2
+
+        rowStart, colStart, rowStop, colStop = bbox if bbox else (0, 0, fullRows, maxCol)
+        rowStart, colStart = max(0, rowStart), max(0, colStart)
+        rowStop, colStop = min(rowStop, fullRows), min(colStop, maxCol)
+        nRows, nCols = max(0, rowStop - rowStart), max(0, colStop - colStart)
+
+        ids = np.zeros((nRows, nCols), dtype=np.int32)
+        parity = None
+        if nRows and nCols:
+            rows = ws.iter_rows(min_row=2 * rowStart + 1, max_row=2 * rowStop,
+                                min_col=colStart + 1, max_col=colStop, values_only=True)
+            blankRow = (None,) * nCols
+            for bandStart in range(0, nRows, tileSize):
+                bandRows = 2 * min(tileSize, nRows - bandStart)
+                # Pad the band's rows to a full 2-D block and convert it in one call
+                cells = [row[:nCols] + blankRow[len(row):] for _, row in zip(range(bandRows), rows)]
+                cells += [blankRow] * (bandRows - len(cells))
+                band = _numericCells(cells)
+                if np.nanmax(band, initial=0) > np.iinfo(ids.dtype).max:
+                    ids = ids.astype(np.int64)
+                parity = _placeHexes(band, ids, bandStart, parity)
+    finally:
+        workbook.close()
+
+    return HexMap(ids, parity or 0, origin=(rowStart, colStart))
+
+
+# === Hex Distance ===
+
+def axialDistance(qa, ra, qb, rb):
+    """
+    Cube distance between axial coordinates, with NumPy broadcasting.
+
+    Args:
+        qa, ra (array-like): Axial coordinates of the start hexes.
+        qb, rb (array-like): Axial coordinates of the end hexes.
+
+    Returns:
+        np.ndarray: Hex step counts with the broadcast shape of the inputs.
+    """
+    dq = np.subtract(qa, qb)
+    dr = np.subtract(ra, rb)
+    ds = dq + dr  # s = -q - r, so |ds| = |dq + dr|
+    return np.maximum(np.maximum(np.abs(dq), np.abs(dr)), np.abs(ds))
+
+
+def hexDistance(hexMap, startHexes, endHexes):
+    """
+    Element-wise hex distance between start and end hex IDs.
+
+    Replaces the per-pair "Distance Calc" formulas in distcalcAttemp.xlsx.
+    Inputs broadcast against each other, so a single start hex can be
+    measured against an array of end hexes.
+
+    Args:
+        hexMap (HexMap): Map the hex IDs belong to.
+        startHexes (array-like): Start hex IDs.
+        endHexes (array-like): End hex IDs.
+
+    Returns:
+        np.ndarray: Distances in hexes with the broadcast shape of the inputs.
+    """
+    qa, ra = hexMap.axial(startHexes)
+    qb, rb = hexMap.axial(endHexes)
+    return axialDistance(qa, ra, qb, rb)
+
+
+def hexDistanceMatrix(hexMap, startHexes, endHexes):
+    """
+    Full N x M distance matrix between two lists of hex IDs.
+
+    Args:
+        hexMap (HexMap): Map the hex IDs belong to.
+        startHexes (array-like): N start hex IDs (e.g. unit positions).
+        endHexes (array-like): M end hex IDs (e.g. target positions).
+
+    Returns:
+        np.ndarray: (N, M) array where [i, j] is the distance from
+        startHexes[i] to endHexes[j].
+    """
+    qa, ra = hexMap.axial(np.ravel(startHexes))
+    qb, rb = hexMap.axial(np.ravel(endHexes))
+    return axialDistance(qa[:, None], ra[:, None], qb[None, :], rb[None, :])
+
+
+# === Spatial Index ===
+
+@functools.lru_cache(maxsize=64)
+def hexRingOffsets(radius):
+    """
+    Axial (dq, dr) offsets of every hex within a radius, ordered by ring.
+
+    Results are cached per radius and returned read-only.
+
+    Args:
+        radius (int): Maximum distance in hexes (0 returns just the centre).
+
+    Returns:
+        np.ndarray: (3R^2 + 3R + 1, 2) int array of offsets.
+    """
+    radius = int(radius)
+    if radius < 0:
+        raise ValueError(f"Radius must be non-negative, got {radius}")
+
+    dq, dr = np.meshgrid(np.arange(-radius, radius + 1), np.arange(-radius, radius + 1), indexing="ij")
+    dq, dr = dq.ravel(), dr.ravel()
+    dist = axialDistance(dq, dr, 0, 0)
+    keep = dist <= radius
+    order = np.argsort(dist[keep], kind="stable")
+    offsets = np.stack([dq[keep][order], dr[keep][order]], axis=1).astype(np.int32)
+    offsets.setflags(write=False)
+    return offsets
+
+
+def hexesWithinRange(hexMap, centerHex, radius):
+    """
+    Return all hex IDs within a radius of a hex without scanning the map.
+
+    Args:
+        hexMap (HexMap): Map to query.
+        centerHex (int): Centre hex ID.
+        radius (int): Range in hexes (inclusive).
+
+    Returns:
+        np.ndarray: Hex IDs on the map within range, nearest rings first.
+    """
+    q, r = hexMap.axial(centerHex)
+    offsets = hexRingOffsets(radius)
+    found = hexMap.axialToId(offsets[:, 0] + q, offsets[:, 1] + r)
+    return found[found != 0]
+
+
+class UnitSpatialIndex:
+    """
+    Bucketed hash of unit positions for "units within range" queries.
+
+    Units are hashed into square buckets of axial coordinates, so a range
+    query only looks at the buckets overlapping the query area and then
+    filters those candidates by exact hex distance.
+    """
+
+    def __init__(self, hexMap, bucketSize=8):
+        """
+        Args:
+            hexMap (HexMap): Map unit positions refer to.
+            bucketSize (int): Bucket edge length in hexes.
+        """
+        self.hexMap = hexMap
+        self.bucketSize = max(1, int(bucketSize))
+        self._positions = {}  # unitId -> (hexId, q, r)
+        self._buckets = {}    # (bq, br) -> set of unitIds
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __contains__(self, unitId):
+        return unitId in self._positions
+
+    def _bucketKey(self, q, r):
+        return (q // self.bucketSize, r // self.bucketSize)
+
+    def place(self, unitId, hexId):
+        """
+        Add a unit or move it to a new hex.
+
+        Args:
+            unitId (Hashable): Unit identifier.
+            hexId (int): Hex the unit occupies.
+        """
+        q, r = self.hexMap.axial(hexId)
+        q, r = int(q), int(r)
+        self.remove(unitId)
+        self._positions[unitId] = (int(hexId), q, r)
+        self._buckets.setdefault(self._bucketKey(q, r), set()).add(unitId)
+
+    def placeMany(self, unitIds, hexIds):
+        """
+        Add or move several units at once.
+
+        Args:
+            unitIds (Iterable): Unit identifiers.
+            hexIds (array-like): Hexes aligned with unitIds.
+        """
+        qs, rs = self.hexMap.axial(np.ravel(hexIds))
+        for unitId, hexId, q, r in zip(unitIds, np.ravel(hexIds), qs.tolist(), rs.tolist()):
+            self.remove(unitId)
+            self._positions[unitId] = (int(hexId), q, r)
+            self._buckets.setdefault(self._bucketKey(q, r), set()).add(unitId)
+
+    def remove(self, unitId):
+        """
+        Remove a unit from the index (no-op if it is not indexed).
+
+        Args:
+            unitId (Hashable): Unit identifier.
+        """
+        entry = self._positions.pop(unitId, None)
+        if entry is None:
+            return
+        key = self._bucketKey(entry[1], entry[2])
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket.discard(unitId)
+            if not bucket:
+                del self._buckets[key]
+
+    def positionOf(self, unitId):
+        """Return the hex ID a unit occupies."""
+        return self._positions[unitId][0]
+
+    def unitsWithinRange(self, centerHex, radius):
+        """
+        Return units within a radius of a hex.
+
+        Args:
+            centerHex (int): Centre hex ID.
+            radius (int): Range in hexes (inclusive).
+
+        Returns:
+            List[Tuple[Hashable, int]]: (unitId, distance) pairs sorted by distance.
+        """
+        q, r = self.hexMap.axial(centerHex)
+        q, r, radius = int(q), int(r), int(radius)
+        bq0, br0 = self._bucketKey(q - radius, r - radius)
+        bq1, br1 = self._bucketKey(q + radius, r + radius)
+
+        candidates = []
+        for bq in range(bq0, bq1 + 1):
+            for br in range(br0, br1 + 1):
+                candidates.extend(self._buckets.get((bq, br), ()))
+        if not candidates:
+            return []
+
+        qs = np.fromiter((self._positions[u][1] for u in candidates), dtype=np.int64, count=len(candidates))
+        rs = np.fromiter((self._positions[u][2] for u in candidates), dtype=np.int64, count=len(candidates))
+        dist = axialDistance(qs, rs, q, r)
+        hits = np.nonzero(dist <= radius)[0]
+        hits = hits[np.argsort(dist[hits], kind="stable")]
+        return [(candidates[i], int(dist[i])) for i in hits]
+
+    def unitsNearUnit(self, unitId, radius):
+        """
+        Return other units within a radius of a unit (e.g. a ship's sensor range).
+
+        Args:
+            unitId (Hashable): Reference unit.
+            radius (int): Range in hexes (inclusive).
+
+        Returns:
+            List[Tuple[Hashable, int]]: (unitId, distance) pairs sorted by distance.
+        """
+        hits = self.unitsWithinRange(self.positionOf(unitId), radius)
+        return [(u, d) for u, d in hits if u != unitId]
+
+
+# === Pathfinding ===
+
+def loadMoveCosts(hexMap, fName, sheetName=0, hexColumn="Hex", costColumns=("Cost",), defaultCost=1.0):
+    """
+    Build a per-hex movement cost array from an SME resource sheet.
+
+    The sheet needs a header row with a hex ID column and one or more cost
+    columns (e.g. base cost, sea state, restricted water). Listed costs are
+    summed per hex, skipping blank cells; hexes missing from the sheet keep
+    defaultCost. A hex is impassable when all its cost cells are blank, any
+    of them holds the text 'X', or the total is negative.
+
+    Args:
+        hexMap (HexMap): Map the costs apply to.
+        fName (str): Path to the resource workbook.
+        sheetName (str | int): Sheet holding the cost table.
+        hexColumn (str): Header of the hex ID column.
+        costColumns (Sequence[str]): Headers of the cost columns to sum.
+        defaultCost (float): Cost for hexes not listed in the sheet.
+
+    Returns:
+        np.ndarray: Float costs aligned with hexMap.hexIds (np.inf = impassable).
+    """
+    if isinstance(costColumns, str):
+        costColumns = (costColumns,)
+    import pandas as pb
+
+    table = pb.read_excel(fName, sheet_name=sheetName, usecols=[hexColumn, *costColumns])
+
+    hexIds = pb.to_numeric(table[hexColumn], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    raw = table[list(costColumns)]
+    parts = raw.apply(pb.to_numeric, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    blocked = raw.apply(lambda col: col.astype(str).str.strip().str.upper().eq("X")).to_numpy().any(axis=1)
+    allBlank = np.isnan(parts).all(axis=1)
+    total = np.nansum(parts, axis=1)  # A blank modifier adds nothing
+    total[allBlank | blocked | ~np.isfinite(total) | (total < 0)] = np.inf
+
+    listed = np.isfinite(hexIds)
+    costs = np.full(len(hexMap), float(defaultCost))
+    costs[hexMap.slots(hexIds[listed].astype(np.int64))] = total[listed]
+    return costs
+
+
+class HexRouter:
+    """
+    Terrain-weighted A* router with an LRU route cache.
+
+    Entering a hex costs that hex's movement cost. Routes are cached under
+    (origin, destination, cost-table hash), so swapping cost tables between
+    moves never returns a stale route, and unchanged tables reuse earlier work.
+    """
+
+    def __init__(self, hexMap, costs=None, cacheSize=4096):
+        """
+        Args:
+            hexMap (HexMap): Map to route over.
+            costs (array-like, optional): Per-hex costs aligned with hexMap.hexIds.
+                Defaults to 1 for every hex.
+            cacheSize (int): Maximum number of cached routes.
+        """
+        self.hexMap = hexMap
+        self.cacheSize = int(cacheSize)
+        self._cache = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.setCosts(np.ones(len(hexMap)) if costs is None else costs)
+
+    def setCosts(self, costs):
+        """
+        Switch to a new cost table.
+
+        Args:
+            costs (array-like): Per-hex costs aligned with hexMap.hexIds.
+        """
+        costs = np.asarray(costs, dtype=float)
+        if costs.shape != (len(self.hexMap),):
+            raise ValueError(f"Expected {len(self.hexMap)} costs, got shape {costs.shape}")
+        self.costs = costs
+        self.costHash = hashlib.sha1(costs.tobytes()).hexdigest()
+        passable = costs[np.isfinite(costs)]
+        self._minCost = float(passable.min()) if len(passable) else 0.0
+
+    def clearCache(self):
+        """Drop all cached routes."""
+        self._cache.clear()
+
+    def route(self, origin, destination):
+        """
+        Return the cheapest route between two hexes.
+
+        Args:
+            origin (int): Start hex ID.
+            destination (int): End hex ID.
+
+        Returns:
+            Tuple[Tuple[int, ...] | None, float]: Hex IDs from origin to destination
+            and the total cost, or (None, inf) if the destination is unreachable.
+        """
+        key = (int(origin), int(destination), self.costHash)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        result = self._search(*self.hexMap.slots([origin, destination]).tolist())
+        self._cache[key] = result
+        if len(self._cache) > self.cacheSize:
+            self._cache.popitem(last=False)
+        return result
+
+    def _search(self, start, goal):
+        neighbors = self.hexMap.neighborSlots()
+        coords = self.hexMap.coords
+        costs = self.costs
+        goalQ, goalR = int(coords[goal, 2]), int(coords[goal, 3])
+
+        def heuristic(slot):
+            dq = int(coords[slot, 2]) - goalQ
+            dr = int(coords[slot, 3]) - goalR
+            return max(abs(dq), abs(dr), abs(dq + dr)) * self._minCost
+
+        best = {start: 0.0}
+        cameFrom = {}
+        frontier = [(heuristic(start), 0.0, start)]
+        while frontier:
+            _, spent, slot = heapq.heappop(frontier)
+            if slot == goal:
+                path = [slot]
+                while slot in cameFrom:
+                    slot = cameFrom[slot]
+                    path.append(slot)
+                hexIds = self.hexMap.hexIds[path[::-1]]
+                return tuple(int(h) for h in hexIds), spent
+            if spent > best.get(slot, np.inf):
+                continue
+            for nxt in neighbors[slot]:
+                if nxt < 0 or not np.isfinite(costs[nxt]):
+                    continue
+                nxt = int(nxt)
+                newCost = spent + float(costs[nxt])
+                if newCost < best.get(nxt, np.inf):
+                    best[nxt] = newCost
+                    cameFrom[nxt] = slot
+                    heapq.heappush(frontier, (newCost + heuristic(nxt), newCost, nxt))
+        return None, np.inf
+
+
+# === Movement Envelopes ===
+
+# Per-process views of the shared map arrays, filled by _initEnvelopeWorker
+_envelopeShared = {}
+
+
+def _floodFill(neighbors, costs, start, budget):
+    """
+    Bounded Dijkstra flood fill returning a packed bitmask of reachable hexes.
+    """
+    best = {start: 0.0}
+    frontier = [(0.0, start)]
+    while frontier:
+        spent, slot = heapq.heappop(frontier)
+        if spent > best[slot]:
+            continue
+        for nxt in neighbors[slot].tolist():
+            if nxt < 0:
+                continue
+            newCost = spent + costs[nxt]
+            if newCost <= budget and newCost < best.get(nxt, np.inf):
+                best[nxt] = newCost
+                heapq.heappush(frontier, (newCost, nxt))
+
+    mask = np.zeros(len(costs), dtype=bool)
+    mask[np.fromiter(best, dtype=np.int64, count=len(best))] = True
+    return np.packbits(mask)
+
+
+def _shareArray(array):
+    """Copy an array into a new shared memory block; returns (block, spec)."""
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+    return block, (block.name, array.shape, array.dtype.str)
+
+
+def _initEnvelopeWorker(neighborSpec, costSpec):
+    """Pool initializer: attach to the shared neighbour and cost arrays once per worker."""
+    for key, (name, shape, dtype) in (("neighbors", neighborSpec), ("costs", costSpec)):
+        block = shared_memory.SharedMemory(name=name)
+        _envelopeShared[key + "Block"] = block
+        _envelopeShared[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _envelopeTask(starts, budgets):
+    neighbors = _envelopeShared["neighbors"]
+    costs = _envelopeShared["costs"]
+    return [_floodFill(neighbors, costs, s, b) for s, b in zip(starts, budgets)]
+
+
+def reachableSets(hexMap, startHexes, budgets, costs=None, maxWorkers=None, chunkSize=16, packed=True):
+    """
+    Compute every unit's movement envelope for this move.
+
+    Each unit gets a bounded Dijkstra flood fill from its start hex, spending
+    the per-hex movement cost of every hex entered. Units are split across a
+    ProcessPoolExecutor; the neighbour table and cost array are placed in
+    shared memory once instead of being pickled for each task. On Windows,
+    call this from under an ``if __name__ == "__main__":`` guard.
+
+    Args:
+        hexMap (HexMap): Map to move over.
+        startHexes (array-like): Start hex ID of each unit.
+        budgets (float | array-like): Movement points per unit.
+        costs (array-like, optional): Per-hex costs aligned with hexMap.hexIds
+            (see loadMoveCosts). Defaults to 1 for every hex.
+        maxWorkers (int, optional): Pool size; 1 runs serially in-process.
+        chunkSize (int): Units per pool task.
+        packed (bool): If True return packed bitmasks, otherwise booleans.
+
+    Returns:
+        np.ndarray: (units, ceil(N/8)) uint8 bitmasks (np.packbits order) or
+        (units, N) booleans, with bits aligned to hexMap.hexIds.
+    """
+    starts = hexMap.slots(np.ravel(startHexes)).tolist()
+    budgets = np.broadcast_to(np.asarray(budgets, dtype=float), (len(starts),)).tolist()
+    costs = np.ones(len(hexMap)) if costs is None else np.asarray(costs, dtype=float)
+    neighbors = hexMap.neighborSlots()
+
+    if maxWorkers == 1 or len(starts) <= chunkSize:
+        rows = [_floodFill(neighbors, costs, s, b) for s, b in zip(starts, budgets)]
+    else:
+        neighborBlock, neighborSpec = _shareArray(neighbors)
+        costBlock, costSpec = _shareArray(costs)
+        try:
+            with ProcessPoolExecutor(max_workers=maxWorkers,
+                                     initializer=_initEnvelopeWorker,
+                                     initargs=(neighborSpec, costSpec)) as pool:
+                chunks = [pool.submit(_envelopeTask, starts[i:i + chunkSize], budgets[i:i + chunkSize])
+                          for i in range(0, len(starts), chunkSize)]
+                rows = [row for chunk in chunks for row in chunk.result()]
+        finally:
+            for block in (neighborBlock, costBlock):
+                block.close()
+                block.unlink()
+
+    masks = np.stack(rows) if rows else np.zeros((0, (len(hexMap) + 7) // 8), dtype=np.uint8)
+    if packed:
+        return masks
+    return np.unpackbits(masks, axis=1, count=len(hexMap)).astype(bool)
+
+
+def envelopeHexIds(hexMap, envelope):
+    """
+    Return the hex IDs in one unit's envelope.
+
+    Args:
+        hexMap (HexMap): Map the envelope was computed on.
+        envelope (np.ndarray): One row from reachableSets (packed or boolean).
+
+    Returns:
+        np.ndarray: Reachable hex IDs.
+    """
+    envelope = np.asarray(envelope)
+    if envelope.dtype != bool:
+        envelope = np.unpackbits(envelope, count=len(hexMap)).astype(bool)
+    return hexMap.hexIds[envelope]
+
+
+def ordersWithinEnvelopes(hexMap, envelopes, destinationHexes):
+    """
+    Check each unit's ordered destination against its packed envelope.
+
+    Args:
+        hexMap (HexMap): Map the envelopes were computed on.
+        envelopes (np.ndarray): Packed (units, ceil(N/8)) output of reachableSets.
+        destinationHexes (array-like): Ordered destination hex ID per unit.
+
+    Returns:
+        np.ndarray: Boolean per unit, True where the order is reachable.
+    """
+    slots = hexMap.slots(np.ravel(destinationHexes))
+    byte = envelopes[np.arange(len(slots)), slots >> 3]
+    return ((byte >> (7 - (slots & 7))) & 1).astype(bool)
+
+
+# === Threat Rasters ===
+
+def loadPlatformRanges(fName, sheetName=0, platformColumn="Platform", rangeColumns=("WeaponRange", "SensorRange")):
+    """
+    Read per-platform ranges (in hexes) from an SME resource sheet.
+
+    Args:
+        fName (str): Path to the resource workbook.
+        sheetName (str | int): Sheet holding the platform table.
+        platformColumn (str): Header of the platform name column.
+        rangeColumns (Sequence[str]): Headers of the range columns to read.
+
+    Returns:
+        Dict[str, Dict[str, float]]: platform -> {rangeColumn: range}; blank
+        ranges are NaN (no coverage).
+    """
+    if isinstance(rangeColumns, str):
+        rangeColumns = (rangeColumns,)
+    import pandas as pb
+
+    table = pb.read_excel(fName, sheet_name=sheetName, usecols=[platformColumn, *rangeColumns])
+    ranges = table[list(rangeColumns)].apply(pb.to_numeric, errors="coerce")
+
+    platformRanges = {}
+    for platform, values in zip(table[platformColumn].astype(str).str.strip(), ranges.to_numpy(dtype=float, na_value=np.nan)):
+        platformRanges[platform] = dict(zip(rangeColumns, values.tolist()))
+    return platformRanges
+
+
+def threatRasters(hexMap, unitHexes, unitSides, unitPlatforms, platformRanges, rangeKey="WeaponRange",
+                  weights=None, maxBlock=1 << 22):
+    """
+    Build per-side threat rasters from unit positions and platform ranges.
+
+    Each side's raster is the convolution of its weighted unit-position raster
+    with a hex-disc kernel of each platform's range. Units sharing a hex and
+    range are merged first, then every (source, kernel offset) pair is scattered
+    with one bincount per block, so there is no per-unit or per-hex Python loop.
+
+    Args:
+        hexMap (HexMap): Map to rasterise over.
+        unitHexes (array-like): Hex ID of each unit.
+        unitSides (array-like): Side of each unit (e.g. 'Blue', 'Red').
+        unitPlatforms (Sequence[str]): Platform of each unit, keyed into platformRanges.
+        platformRanges (Dict[str, Dict[str, float]]): Output of loadPlatformRanges.
+        rangeKey (str): Which range to use (weapon vs sensor coverage).
+        weights (array-like, optional): Per-unit contribution (e.g. Pk); defaults to 1,
+            which makes each raster a count of overlapping threats.
+        maxBlock (int): Upper bound on source-offset pairs scattered at once.
+
+    Returns:
+        Dict[Hashable, np.ndarray]: side -> float32 threat values aligned with hexMap.hexIds.
+    """
+    slots = hexMap.slots(np.ravel(unitHexes))
+    sides = np.asarray(unitSides)
+    ranges = np.array([platformRanges.get(p, {}).get(rangeKey, np.nan) for p in unitPlatforms], dtype=float)
+    weights = np.ones(len(slots)) if weights is None else np.broadcast_to(np.asarray(weights, dtype=float), (len(slots),))
+
+    covered = np.isfinite(ranges) & (ranges >= 0)
+    radii = np.where(covered, np.floor(np.where(covered, ranges, 0)), -1).astype(np.int64)
+
+    rasters = {}
+    for side in np.unique(sides).tolist():
+        raster = np.zeros(len(hexMap), dtype=np.float64)
+        onSide = (sides == side) & covered
+        for radius in np.unique(radii[onSide]).tolist():
+            group = onSide & (radii == radius)
+            sourceSlots, inverse = np.unique(slots[group], return_inverse=True)
+            sourceWeights = np.bincount(inverse, weights=weights[group])
+
+            offsets = hexRingOffsets(radius)
+            step = max(1, maxBlock // len(offsets))
+            for i in range(0, len(sourceSlots), step):
+                block = sourceSlots[i:i + step]
+                q = hexMap.coords[block, 2, None] + offsets[None, :, 0]
+                r = hexMap.coords[block, 3, None] + offsets[None, :, 1]
+                hits = hexMap.axialToId(q, r)
+                onMap = hits != 0
+                blockWeights = np.broadcast_to(sourceWeights[i:i + step, None], hits.shape)[onMap]
+                raster += np.bincount(hexMap.slots(hits[onMap]), weights=blockWeights, minlength=len(hexMap))
+        rasters[side] = raster.astype(np.float32)
+    return rasters
+
+
+def rasterToGrid(hexMap, values, fill=np.nan):
+    """
+    Lay per-hex values out on the compact ID grid (e.g. for display).
+
+    Args:
+        hexMap (HexMap): Map the values belong to.
+        values (array-like): Values aligned with hexMap.hexIds.
+        fill (float): Value for grid cells without a hex.
+
+    Returns:
+        np.ndarray: Float grid shaped like hexMap.ids.
+    """
+    grid = np.full(hexMap.shape, fill, dtype=np.float32)
+    grid[hexMap.coords[:, 0], hexMap.coords[:, 1]] = values
+    return grid
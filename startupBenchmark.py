@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+Measure MAAGE GUI start-up time against a synthetic cheat sheet.
+
+Reports, each as the median of several fresh interpreter runs:
+    - import time of MDW25GuiHeader and mapAlgorithmLibrary (and which heavy
+      packages the import pulled in),
+    - time to first paint (root window mapped),
+    - time to interactive (cheat sheet parsed, tabs built, background loads idle),
+    - time until the first cheat sheet tab is built after being selected.
+
+The GUI runs (MDW25Gui.py) need a display; import timings do not.
+
+Usage:
+    python startupBenchmark.py [--tabs 8] [--sheets 6] [--entries 10] [--repeats 5] [--keep DIR]
+"""
+
+import argparse
+import json
+import os
+import runpy
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+HEAVY_MODULES = ("pandas", "numpy", "openpyxl", "pyarrow", "PIL")
+GUI_TIMEOUT = 120.0  # Seconds before a GUI run is abandoned
+
+# === Synthetic Cheat Sheet ===
+
+def writeSyntheticCheatSheet(folder, tabCount=8, sheetsPerTab=6, entriesPerTab=10, rowsPerSheet=200):
+    """
+    Write resource workbooks and a matching MAAGECheatSheet.txt into a folder.
+
+    Args:
+        folder (str): Output folder (created if missing).
+        tabCount (int): Number of cheat sheet tabs (one workbook each).
+        sheetsPerTab (int): Sheets per workbook.
+        entriesPerTab (int): Cheat sheet entries per tab (cycling over the sheets).
+        rowsPerSheet (int): Data rows written to every sheet.
+
+    Returns:
+        str: Path of the cheat sheet.
+    """
+    import openpyxl
+
+    os.makedirs(folder, exist_ok=True)
+    lines = []
+    for tabIdx in range(tabCount):
+        workbookPath = os.path.join(folder, f"Resources{tabIdx + 1}.xlsx")
+        workbook = openpyxl.Workbook()
+        workbook.remove(workbook.active)
+        for sheetIdx in range(sheetsPerTab):
+            ws = workbook.create_sheet(f"Sheet{sheetIdx + 1}")
+            ws.append(["Platform", "Range", "Pk", "Cost"])
+            for row in range(rowsPerSheet):
+                ws.append([f"P{row}", row % 50, (row % 100) / 100, row * 1.5])
+        workbook.save(workbookPath)
+
+        lines.append(f"TabName,Tab {tabIdx + 1}")
+        lines.append(f"Filepath,{workbookPath}")
+        for entryIdx in range(entriesPerTab):
+            lines.append(f"Entry {entryIdx + 1}, Sheet{entryIdx % sheetsPerTab + 1}, 1, A:D")
+        lines.append("")
+
+    cheatSheetPath = os.path.join(folder, "MAAGECheatSheet.txt")
+    with open(cheatSheetPath, "w") as f:
+        f.write("\n".join(lines))
+    return cheatSheetPath
+
+
+# === Import Timing ===
+
+_IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measureImport(moduleName, repeats=5):
+    """
+    Time importing a repo module in fresh interpreters.
+
+    Args:
+        moduleName (str): Module to import.
+        repeats (int): Number of runs.
+
+    Returns:
+        Tuple[float, List[str]]: Median seconds and the heavy packages loaded by the import.
+    """
+    probe = _IMPORT_PROBE.format(module=moduleName, heavy=HEAVY_MODULES)
+    times, loaded = [], []
+    for _ in range(repeats):
+        result = subprocess.run([sys.executable, "-c", probe], cwd=REPO_DIR,
+                                capture_output=True, text=True, check=True)
+        sample = json.loads(result.stdout.strip().splitlines()[-1])
+        times.append(sample["seconds"])
+        loaded = sample["loaded"]
+    return statistics.median(times), loaded
+
+
+# === GUI Timing ===
+
+def _runGuiChild(folder):
+    """
+    Run MDW25Gui.py in this process and print its start-up timings as JSON.
+
+    tkinter.Tk.mainloop is wrapped so that, once the script enters the event
+    loop, the run can watch for the first <Map> of the root window, for the
+    background cheat sheet load to finish, and for the first tab to build.
+    """
+    start = time.perf_counter()
+    import tkinter as tk
+
+    marks = {}
+    originalMainloop = tk.Tk.mainloop
+
+    def mark(name):
+        marks.setdefault(name, time.perf_counter() - start)
+
+    def finish(root, scriptGlobals):
+        print(json.dumps(marks), flush=True)
+        scriptGlobals["fileWatcher"].stop()
+        scriptGlobals["loader"].shutdown()
+        scriptGlobals["gui"].fileStatusService.stop()
+        root.destroy()
+
+    def instrumentedMainloop(root, n=0):
+        scriptGlobals = sys._getframe(1).f_globals
+        tabControl = scriptGlobals["tabControl"]
+        loader = scriptGlobals["loader"]
+
+        root.bind("<Map>", lambda event: mark("firstPaint") if event.widget is root else None, add="+")
+
+        def poll():
+            elapsed = time.perf_counter() - start
+            tabs = tabControl.tabs()
+            if "interactive" not in marks and scriptGlobals["tabData"] and not loader.busy:
+                mark("interactive")
+                if len(tabs) > 2:  # Home, cheat sheet tabs..., Map
+                    marks["selectTab"] = time.perf_counter() - start
+                    tabControl.select(tabs[1])
+            if "interactive" in marks:
+                firstTab = tabControl.nametowidget(tabs[1]) if len(tabs) > 2 else None
+                if firstTab is None or getattr(firstTab, "pendingTab", None) is None:
+                    if firstTab is not None:
+                        mark("firstTabBuilt")
+                    finish(root, scriptGlobals)
+                    return
+            if elapsed > GUI_TIMEOUT:
+                marks["timedOut"] = True
+                finish(root, scriptGlobals)
+                return
+            root.after(5, poll)
+
+        root.after(5, poll)
+        originalMainloop(root, n)
+
+    tk.Tk.mainloop = instrumentedMainloop
+    os.chdir(folder)
+    sys.path.insert(0, REPO_DIR)
+    runpy.run_path(os.path.join(REPO_DIR, "MDW25Gui.py"), run_name="__main__")
+
+
+def measureGui(folder, repeats=5):
+    """
+    Time MDW25Gui.py start-up against the cheat sheet in folder.
+
+    Args:
+        folder (str): Folder holding MAAGECheatSheet.txt and its workbooks.
+        repeats (int): Number of runs.
+
+    Returns:
+        Dict[str, float]: Median seconds for firstPaint, interactive and firstTabBuilt
+        (the last measured from the moment the tab was selected).
+
+    Raises:
+        RuntimeError: If the GUI could not start (e.g. no display).
+    """
+    samples = []
+    for _ in range(repeats):
+        result = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", folder],
+                                cwd=folder, capture_output=True, text=True, timeout=GUI_TIMEOUT + 30)
+        lines = [line for line in result.stdout.splitlines() if line.startswith("{")]
+        if result.returncode != 0 or not lines:
+            errorLines = result.stderr.strip().splitlines()
+            raise RuntimeError(errorLines[-1] if errorLines else f"exit code {result.returncode}")
+        sample = json.loads(lines[-1])
+        if sample.get("timedOut"):
+            raise RuntimeError(f"GUI did not become interactive within {GUI_TIMEOUT:.0f}s")
+        if "firstTabBuilt" in sample:
+            sample["firstTabBuilt"] -= sample.pop("selectTab")
+        samples.append(sample)
+
+    keys = [key for key in ("firstPaint", "interactive", "firstTabBuilt") if all(key in s for s in samples)]
+    return {key: statistics.median(s[key] for s in samples) for key in keys}
+
+
+# === Main ===
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure MAAGE GUI start-up time.")
+    parser.add_argument("--tabs", type=int, default=8, help="cheat sheet tabs to generate")
+    parser.add_argument("--sheets", type=int, default=6, help="sheets per workbook")
+    parser.add_argument("--entries", type=int, default=10, help="cheat sheet entries per tab")
+    parser.add_argument("--repeats", type=int, default=5, help="runs per measurement (median is reported)")
+    parser.add_argument("--keep", metavar="DIR", help="write the synthetic data here and keep it")
+    parser.add_argument("--child", metavar="DIR", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _runGuiChild(args.child)
+        return
+
+    folder = args.keep or tempfile.mkdtemp(prefix="maage_bench_")
+    try:
+        writeSyntheticCheatSheet(folder, args.tabs, args.sheets, args.entries)
+        print(f"Synthetic cheat sheet: {args.tabs} tabs x {args.entries} entries ({folder})")
+
+        for moduleName in ("MDW25GuiHeader", "mapAlgorithmLibrary"):
+            seconds, loaded = measureImport(moduleName, args.repeats)
+            print(f"import {moduleName:<20} {seconds * 1000:8.1f} ms   heavy modules: {', '.join(loaded) or 'none'}")
+
+        try:
+            timings = measureGui(folder, args.repeats)
+        except (RuntimeError, subprocess.TimeoutExpired) as e:
+            print(f"GUI timings unavailable: {e}")
+        else:
+            print(f"first paint                 {timings.get('firstPaint', float('nan')) * 1000:8.1f} ms")
+            print(f"time to interactive         {timings.get('interactive', float('nan')) * 1000:8.1f} ms")
+            print(f"first tab built (on select) {timings.get('firstTabBuilt', float('nan')) * 1000:8.1f} ms")
+    finally:
+        if not args.keep:
+            shutil.rmtree(folder, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()